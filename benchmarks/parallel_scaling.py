@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+    parallel_scaling
+    ================
+
+    Compares the "parallel" engine of pathfinder with the single process "bfs" engine
+    on one large 3-dimensional maze, with 1, 2, 4 and 8 workers.
+
+    Each Solver is created and warmed up by a first search before being timed, so the start
+    of the worker processes and the copy of the maze to shared memory are not measured (they
+    are paid once per Solver). The best time of --repeat searches is kept. A speedup needs at
+    least as many free CPUs as workers, and a maze of at least 2^19 cases (smaller mazes are
+    solved by "bfs").
+
+    Exemple :
+    ---------
+    $ python benchmarks/parallel_scaling.py --size 120 --density 0.2
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+import pathfinder
+
+
+def randomMaze(size: int, density: float, seed: int) -> list:
+    """
+        Returns a size*size*size maze of random walls, starting point and exit in opposite corners.
+    """
+
+    rng = random.Random(seed)
+    maze = [[[pathfinder.WALL if rng.random() < density else pathfinder.PATH for _ in range(size)] for _ in range(size)] for _ in range(size)]
+    maze[0][0][0] = pathfinder.START
+    maze[-1][-1][-1] = pathfinder.END
+    return maze
+
+
+def timeSolve(solver: pathfinder.Solver, repeat: int) -> (float, list):
+    """
+        Returns the best time of repeat searches of solver, after a first search that is not timed, and the path.
+    """
+
+    path = solver.solve()
+    best = float("inf")
+    for _ in range(repeat):
+        t = time.perf_counter()
+        path = solver.solve()
+        best = min(best, time.perf_counter() - t)
+    return best, path
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=100, help="length of each dimension")
+    parser.add_argument("--density", type=float, default=0.2, help="probability of a wall")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--repeat", type=int, default=3, help="timed searches of each solver, the best time is kept")
+    args = parser.parse_args()
+
+    maze = randomMaze(args.size, args.density, args.seed)
+    reference, path = timeSolve(pathfinder.Solver(maze), args.repeat)
+    print("%d cases, path of %s steps, %d CPUs" % (args.size**3, len(path)-1 if path else None, os.cpu_count()))
+    print("%-10s %10s %8s" % ("engine", "time (s)", "speedup"))
+    print("%-10s %10.3f %8.2f" % ("bfs", reference, 1))
+    for workers in args.workers:
+        with pathfinder.Solver(maze, engine="parallel", workers=workers) as solver:
+            elapsed, parallelPath = timeSolve(solver, args.repeat)
+        assert (parallelPath is None) == (path is None) and (path is None or len(parallelPath) == len(path))
+        print("%-10s %10.3f %8.2f" % ("parallel-%d" % workers, elapsed, reference / elapsed))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,275 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+    suite
+    =====
+
+    Benchmarks of pathfinder on reproducible mazes : resolve, saveNarray/loadNarray
+    (text and binary formats) and narrayFlatten/narrayUnflatten, in 2, 3 and 4 dimensions,
+    from 10^2 cases up to --max-cells cases (10^8 at most).
+
+    Mazes are generated from a seed :
+
+    - perfect : perfect maze (one path between two rooms), carved by a random depth-first search.
+    - open : no wall at all.
+    - walls : random walls of probability --density.
+    - time : maze[t][x][y]... of random walls with a JUMP_FORWARD time dimension (first dimension).
+
+    For each benchmark, the best wall time of --repeat runs is kept, then the operation
+    runs once more under tracemalloc for its peak memory. Results are printed as a table
+    and written as JSON with --output, another result file can be compared with --compare.
+
+    Exemple :
+    ---------
+    $ python benchmarks/suite.py --max-cells 1000000 --output results.json
+    $ python benchmarks/suite.py --max-cells 1000000 --compare results.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from math import prod
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+import pathfinder
+
+
+SIZES = [10**2, 10**4, 10**6, 10**8]
+DIMENSIONS = [2, 3, 4]
+
+
+def mazeShape(cells: int, dimension: int, odd=False) -> list:
+    """
+        Returns the shape of a maze of about cells cases (odd lengths if odd is True).
+    """
+
+    side = max(3, round(cells ** (1 / dimension)))
+    if odd and side % 2 == 0:
+        side += 1
+    return [side] * dimension
+
+
+def perfectMaze(shape: list, seed: int) -> pathfinder.FlatNarray:
+    """
+        Returns a perfect maze : rooms at even coordinates, carved by a random depth-first search.
+        Starting point and exit are in opposite corners.
+    """
+
+    rng = random.Random(seed)
+    strides = pathfinder.narrayStrides(shape)
+    cases = bytearray([pathfinder.WALL]) * prod(shape)
+    cases[0] = pathfinder.PATH
+    stack = [(0,) * len(shape)]
+    while stack:
+        c = stack[-1]
+        i = sum(x * s for x, s in zip(c, strides))
+        rooms = []
+        for d, (x, l) in enumerate(zip(c, shape)):
+            for step in (-2, 2):
+                if 0 <= x + step < l and cases[i + step * strides[d]] == pathfinder.WALL:
+                    rooms.append((d, step))
+        if not rooms:
+            stack.pop()
+            continue
+        d, step = rng.choice(rooms)
+        cases[i + step // 2 * strides[d]] = pathfinder.PATH
+        cases[i + step * strides[d]] = pathfinder.PATH
+        stack.append(c[:d] + (c[d] + step,) + c[d+1:])
+    cases[0] = pathfinder.START
+    cases[sum((l - 1 - (l - 1) % 2) * s for l, s in zip(shape, strides))] = pathfinder.END
+    return pathfinder.FlatNarray(cases, shape)
+
+
+def openGrid(shape: list, seed: int) -> pathfinder.FlatNarray:
+    """
+        Returns a maze without walls, starting point and exit in opposite corners.
+    """
+
+    cases = bytearray(prod(shape))
+    cases[0] = pathfinder.START
+    cases[-1] = pathfinder.END
+    return pathfinder.FlatNarray(cases, shape)
+
+
+def randomWalls(shape: list, seed: int, density=0.3) -> pathfinder.FlatNarray:
+    """
+        Returns a maze of random walls, starting point and exit in opposite corners.
+    """
+
+    rng = random.Random(seed)
+    cases = bytearray(pathfinder.WALL if rng.random() < density else pathfinder.PATH for _ in range(prod(shape)))
+    cases[0] = pathfinder.START
+    cases[-1] = pathfinder.END
+    return pathfinder.FlatNarray(cases, shape)
+
+
+def timeLayered(shape: list, seed: int, density=0.3) -> pathfinder.FlatNarray:
+    """
+        Returns a maze of random walls whose first dimension is the time (JUMP_FORWARD law) :
+        the starting point is in a corner of the first frame, the exit in the opposite corner of every frame.
+    """
+
+    maze = randomWalls(shape, seed, density)
+    frame = prod(shape[1:])
+    for t in range(shape[0]):
+        maze.cases[t * frame + frame - 1] = pathfinder.END
+    maze.cases[-1] = pathfinder.END
+    return maze
+
+
+GENERATORS = {
+    "perfect": (perfectMaze, {}),
+    "open": (openGrid, {}),
+    "walls": (randomWalls, {}),
+    "time": (timeLayered, {1: pathfinder.JUMP_FORWARD}),
+}
+
+
+def measure(operation, repeat: int, memory: bool) -> (float, int, object):
+    """
+        Returns the best wall time of repeat runs of operation, its peak memory in bytes
+        (None if memory is False) and the result of its last run.
+    """
+
+    best = float("inf")
+    result = None
+    for _ in range(max(repeat, 1)):
+        result = None # libère le résultat précédent avant la mesure
+        t = time.perf_counter()
+        result = operation()
+        best = min(best, time.perf_counter() - t)
+    peak = None
+    if memory: # un dernier passage sous tracemalloc, plus lent, hors mesure du temps
+        result = None
+        tracemalloc.start()
+        try:
+            result = operation()
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return best, peak, result
+
+
+def record(benchmark: str, generator: str, maze: pathfinder.FlatNarray, seconds: float, peak: int, **extra) -> dict:
+    cells = len(maze.cases)
+    return dict(benchmark=benchmark, generator=generator, dimension=len(maze.shape), shape=list(maze.shape),
+                cells=cells, seconds=seconds, cellsPerSecond=cells / seconds if seconds else None, peakBytes=peak, **extra)
+
+
+def benchResolve(generator: str, maze: pathfinder.FlatNarray, laws: dict, args) -> dict:
+    seconds, peak, path = measure(lambda: pathfinder.resolve(maze, laws, engine=args.engine), args.repeat, args.memory)
+    expanded = None # seul le moteur "bfs" compte ses cases étendues (SearchStats), hors mesure
+    if args.engine == "bfs":
+        stats = pathfinder.SearchStats()
+        pathfinder.resolve(maze, laws, stats=stats)
+        expanded = stats.expanded
+    r = record("resolve", generator, maze, seconds, peak, engine=args.engine, expanded=expanded,
+               pathLength=len(path) if path else None)
+    r["expandedPerSecond"] = expanded / seconds if seconds and expanded is not None else None
+    return r
+
+
+def benchFiles(generator: str, maze: pathfinder.FlatNarray, laws: dict, args) -> list:
+    results = []
+    narray = maze.toNarray()
+    with tempfile.TemporaryDirectory() as directory:
+        for binary in (False, True):
+            path = os.path.join(directory, "maze.laby")
+            form = "binary" if binary else "text"
+            seconds, peak, _ = measure(lambda: pathfinder.saveNarray(path, narray, laws, binary), args.repeat, args.memory)
+            results.append(record("saveNarray", generator, maze, seconds, peak, format=form, bytes=os.path.getsize(path)))
+            seconds, peak, _ = measure(lambda: pathfinder.loadNarray(path), args.repeat, args.memory)
+            results.append(record("loadNarray", generator, maze, seconds, peak, format=form))
+            seconds, peak, _ = measure(lambda: pathfinder.loadNarray(path, flat=True), args.repeat, args.memory)
+            results.append(record("loadNarray", generator, maze, seconds, peak, format=form + "-flat"))
+    return results
+
+
+def benchFlatten(generator: str, maze: pathfinder.FlatNarray, laws: dict, args) -> list:
+    narray = maze.toNarray()
+    seconds, peak, flat = measure(lambda: pathfinder.narrayFlatten(narray), args.repeat, args.memory)
+    results = [record("narrayFlatten", generator, maze, seconds, peak)]
+    seconds, peak, _ = measure(lambda: pathfinder.narrayUnflatten(flat, list(maze.shape)), args.repeat, args.memory)
+    results.append(record("narrayUnflatten", generator, maze, seconds, peak))
+    return results
+
+
+BENCHMARKS = {
+    "resolve": benchResolve,
+    "files": benchFiles,
+    "flatten": benchFlatten,
+}
+
+
+def key(result: dict) -> tuple:
+    return result["benchmark"], result.get("format"), result.get("engine"), result["generator"], result["dimension"], result["cells"]
+
+
+def compare(results: list, path: str) -> None:
+    """
+        Prints the time ratio of each result against the result with the same key in the file path.
+    """
+
+    with open(path) as f:
+        previous = {key(r): r for r in json.load(f)["results"]}
+    print("\n%-28s %-8s %3s %12s %10s %10s %7s" % ("benchmark", "maze", "dim", "cells", "before (s)", "after (s)", "ratio"))
+    for r in results:
+        p = previous.get(key(r))
+        if p is None:
+            continue
+        name = r["benchmark"] + ("/" + r["format"] if r.get("format") else "")
+        print("%-28s %-8s %3d %12d %10.4f %10.4f %7.2f" % (name, r["generator"], r["dimension"], r["cells"], p["seconds"], r["seconds"], r["seconds"] / p["seconds"]))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--max-cells", type=int, default=10**6, help="largest maze (cases), sizes are 10^2, 10^4, 10^6 and 10^8")
+    parser.add_argument("--dimensions", type=int, nargs="+", default=DIMENSIONS)
+    parser.add_argument("--generators", nargs="+", default=list(GENERATORS), choices=list(GENERATORS))
+    parser.add_argument("--benchmarks", nargs="+", default=list(BENCHMARKS), choices=list(BENCHMARKS))
+    parser.add_argument("--engine", default="bfs", help="engine of resolve")
+    parser.add_argument("--repeat", type=int, default=3, help="runs of each benchmark, the best time is kept")
+    parser.add_argument("--no-memory", dest="memory", action="store_false", help="do not measure peak memory")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="JSON file of the results")
+    parser.add_argument("--compare", help="JSON file of previous results to compare with")
+    args = parser.parse_args()
+
+    results = []
+    print("%-28s %-8s %3s %12s %10s %14s %12s" % ("benchmark", "maze", "dim", "cells", "time (s)", "cells/s", "peak (MiB)"))
+    for cells in [c for c in SIZES if c <= args.max_cells]:
+        for dimension in args.dimensions:
+            for generator in args.generators:
+                make, laws = GENERATORS[generator]
+                maze = make(mazeShape(cells, dimension, odd=generator == "perfect"), args.seed)
+                for benchmark in args.benchmarks:
+                    new = BENCHMARKS[benchmark](generator, maze, laws, args)
+                    for r in new if type(new) is list else [new]:
+                        name = r["benchmark"] + ("/" + r["format"] if r.get("format") else "")
+                        rate = r.get("expandedPerSecond") or r["cellsPerSecond"] or 0
+                        peak = "%12.2f" % (r["peakBytes"] / 2**20) if r["peakBytes"] is not None else "%12s" % "-"
+                        print("%-28s %-8s %3d %12d %10.4f %14.0f %s" % (name, generator, dimension, r["cells"], r["seconds"], rate, peak))
+                        results.append(r)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "seed": args.seed,
+                "results": results,
+            }, f, indent=1)
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
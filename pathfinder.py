@@ -18,12 +18,37 @@
     [(1, 0), (0, 0), (0, 1), (0, 2), (1, 2), (2, 2), (3, 2), (4, 2)]
 """
 
+from array import array
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from functools import partial
+from heapq import heappush, heappop
+import gzip
+from itertools import product
+import logging
+from math import inf, prod
+from multiprocessing import shared_memory
+import mmap
+import os
+import re
+import struct
+import sys
+import time
+import weakref
+import zlib
+
+try:
+    import numpy # optionnel : seulement nécessaire pour engine="numpy"
+except ImportError:
+    numpy = None
+
 # constantes : types de case du mazee
 PATH     = 0
 WALL     = 1
 START    = 2 # un seul point de départ est autorisé
 END      = 3 # plusieurs sorties sont autorisées
 BANNED   = 4 # les cases déjà parcourues sont bannies (par défaut)
+WEIGHT   = 10 # les cases de valeur WEIGHT + w (1 <= w <= 245) sont des chemins qui coûtent w (moteurs "dijkstra" et "astar")
 
 # constantes : manières de parcourir une dimension
 FREE           = 0 # bidirectionelle (la valeur de la coordonnée peut être incrémentée et décrémentée ou rester statique)
@@ -32,6 +57,23 @@ FORWARD        = 2 # unidirectionelle + (la valeur de la coordonnée peut être
 JUMP_FORWARD   = 3 # unidirectionelle - (la valeur de la coordonnée peut être décrémentée ou rester statique)
 BACKWARD       = 4 # force l'incrémentation de la coordonnée (utile pour les dimensions temporelles)
 JUMP_BACKWARD  = 5 # force la décrémentation de la coordonnée (utile pour les dimensions temporelles)
+CYCLIC         = 6 # comme JUMP_FORWARD, mais la dimension contient une seule période et revient à 0 après la fin
+
+_FIELD_MAGIC = b"PFDF" # en-tête des fichiers de saveDistanceField
+_MAZE_MAGIC = b"PFMZ" # en-tête des fichiers binaires de saveNarray
+_CLUSTER_MAGIC = b"PFCG" # en-tête des fichiers de saveClusterGraph
+_CHUNK = 1 << 20 # taille des morceaux lus par loadNarray
+
+# conversions entre octets de murs et cases pour PackedNarray : 8 cases par octet du bitmap,
+# un octet 0/1 par case lu comme un entier de 8 octets (ordre natif, voir memoryview.cast)
+_BYTE_CASES = [bytes(WALL if b >> k & 1 else PATH for k in range(8)) for b in range(256)]
+_WALL_BITS = bytes(1 if v == WALL else 0 for v in range(256))
+_BITS_BYTE = {int.from_bytes(bytes(b >> k & 1 for k in range(8)), sys.byteorder): b for b in range(256)}
+_PARALLEL_STAGE = 4096 # nombre de cases par processus en dessous duquel une étape n'est pas partagée
+_PARALLEL_CASES = 1 << 19 # nombre de cases en dessous duquel le moteur "parallel" utilise "bfs"
+
+# coût pour entrer dans une case selon sa valeur (0 -> case infranchissable)
+_COSTS = [1 if v in (PATH, END) else v - WEIGHT if v > WEIGHT else 0 for v in range(256)]
 
 
 def getDimension(maze: list) -> int:
@@ -102,6 +144,40 @@ def findStart(maze: list, d=None, n=0, c=()) -> tuple:
             return j
     
 
+def findEnds(maze: list, d=None, n=0, c=()) -> list:
+    """
+        findEnds
+        ========
+
+        Description
+        -----------
+        Returns the coordinates of all the exits of maze.
+
+        Exemple :
+        ---------
+        >>> findEnds([[3,2],[0,3]])
+        [(0, 0), (1, 1)]
+
+        Parameters :
+        ------------
+            maze (list): n-dimensional array of int.
+        
+        Returns :
+        ---------
+            list of tuple of int: the coordinates of the exits.
+    """
+
+    if d is None: d = getDimension(maze)
+
+    if n + 1 == d: # condition d'arrêt : on est à la dernière dimension
+        return [c + (i,) for i in range(len(maze)) if maze[i] == END]
+
+    ends = []
+    for i in range(len(maze)):
+        ends += findEnds(maze[i], d, n+1, c+(i,))
+    return ends
+
+
 def getAdjacentCoordinates(center: tuple, laws={}, force=False) -> list:
     """
         getAdjacentCoordinates
@@ -135,7 +211,7 @@ def getAdjacentCoordinates(center: tuple, laws={}, force=False) -> list:
 
     for d in range(len(center)):
         if d+1 in laws: 
-            if laws[d+1] == JUMP_FORWARD: # si laws indique que la dimension d suit la loi JUMP_FORWARD -> incrémente la coordonnée de center de cette dimension
+            if laws[d+1] in (JUMP_FORWARD, CYCLIC): # si laws indique que la dimension d suit la loi JUMP_FORWARD (ou CYCLIC) -> incrémente la coordonnée de center de cette dimension
                 center = center[:d]+(center[d]+1,)+center[d+1:]
                 laws[d+1] = BLOCKED # bloque temporairement la dimension
                 continue
@@ -342,10 +418,12 @@ def newLaw(d: int, law: int, laws={}) -> dict:
         - JUMP_FORWARD (useful for temporal dimensions)
         - BACKWARD
         - JUMP_BACKWARD (useful for temporal dimensions)
+        - CYCLIC (periodic temporal dimensions, see resolve function)
 
         newLaw("NO_BAN", True) => disable banishment of visited cases, useful for temporal dimensions.
 
-        WARNING : newLaw("NO_BAN", True) significantly increases temporal complexity.
+        WARNING : newLaw("NO_BAN", True) increases temporal complexity : the search keeps
+        each case once per stage instead of once (see resolve function).
 
         Exemples :
         ----------
@@ -400,7 +478,7 @@ def banCase(case: tuple, maze: list) -> None:
     banCase(case[1:], maze[case[0]])
     # revient à faire maze[case1][case2][case3] ... [casen-1][casen] = BANNED avec n le nombre de dimension de case
 
-def appendPath(paths: list, maze: list, laws={}) -> (list, bool):
+def appendPath(paths: list, maze: list, laws={}, visited=None, stats=None) -> (list, bool):
     """
         appendPath
         ==========
@@ -412,12 +490,17 @@ def appendPath(paths: list, maze: list, laws={}) -> (list, bool):
         - remove obsolete paths.
         - duplicates the paths that separate.
         - ban visited cases (see newLaw function to disable case banishment).
+        - without banishment, keep only the first path reaching each case.
+
+        Visited cases are banned in maze, or added to visited if it is a set (maze is then left unchanged).
 
         Parameters :
         ------------
             paths (list of tuple of int): list of paths.
             maze (list): n-dimensional array of int.
             laws (dict): laws.
+            visited (set of tuple of int): coordinates of the visited cases.
+            stats (SearchStats): counters and timers of the search (see SearchStats class).
 
         Returns :
         ---------
@@ -432,328 +515,3591 @@ def appendPath(paths: list, maze: list, laws={}) -> (list, bool):
         noBan = laws["NO_BAN"]
 
     newPaths = [] # contiendra les nouveaux chemins et ceux mis à jour
+    stage = set() # cases atteintes à cette étape : avec NO_BAN, seul le premier chemin qui atteint une case est gardé
     for path in paths:
-        directions = getAdjacents(path[-1], maze, laws) # obtient les coordonnées des cases adjacentes suivant les lois
-        cases = getCases(directions, maze) # obtient les valeurs des cases aux coordonnées de directions
+        if stats is None:
+            directions = getAdjacents(path[-1], maze, laws) # obtient les coordonnées des cases adjacentes suivant les lois
+            cases = getCases(directions, maze) # obtient les valeurs des cases aux coordonnées de directions
+        else:
+            directions, cases = _countedAdjacents(path[-1], maze, laws, stats)
+            accepted, t = len(newPaths), time.perf_counter()
         if END in cases: # si la fin a été trouvée -> retourne le chemin et True
             path.append(directions[cases.index(END)])
             return path, True
 
         for d in range(len(directions)): # si non -> calcule des chemins découlant de path
             if cases[d] == PATH: # si la case est un chemin -> on ajoute un nouveau chemin identique avec en plus les coordonnées de la dernière case chemin
+                if visited is not None and directions[d] in visited:
+                    continue
+                if noBan:
+                    if directions[d] in stage: # les chemins suivants répéteraient les déplacements du premier
+                        continue
+                    stage.add(directions[d])
                 newPaths.append(path.copy())
                 newPaths[-1].append(directions[d])
                 if not noBan: # si le bannissement des cases visitées n'est pas désactivé -> bannit la case
-                    banCase(directions[d], maze)
+                    if visited is None:
+                        banCase(directions[d], maze)
+                    else:
+                        visited.add(directions[d])
+        if stats is not None: # les cases PATH non prolongées étaient déjà visitées
+            stats._time("copy", time.perf_counter() - t)
+            stats.rejectedBanned += cases.count(PATH) - (len(newPaths) - accepted)
 
     return newPaths, False # retourne les nouveaux chemins et False
 
 
-def defaultCallback(arg: {}) -> None:
+def _countedAdjacents(center: tuple, maze: list, laws: dict, stats) -> (list, list):
     """
-        Does nothing ( °_°')
+        Returns getAdjacents(center, maze, laws) and the values of these cases, counting the rejected
+        neighbours (out of the maze, walls and banned cases) and timing the two steps in stats.
     """
 
-    # cette fonction est une fonction inutile utilisée comme fonction par défaut dans resolve()
-    return None
-
-
-def resolve(maze: list, laws={}, callback=defaultCallback) -> list:
+    t = time.perf_counter()
+    coordinates = getAdjacentCoordinates(center, laws)
+    directions = [c for c in coordinates if isLegalCoordinate(c, maze)]
+    t2 = time.perf_counter()
+    cases = getCases(directions, maze)
+    stats._time("adjacents", t2 - t)
+    stats._time("lookup", time.perf_counter() - t2)
+    stats.expanded += 1
+    stats.rejectedBounds += len(coordinates) - len(directions)
+    stats.rejectedBanned += cases.count(BANNED)
+    stats.rejectedWalls += len(cases) - cases.count(PATH) - cases.count(END) - cases.count(BANNED)
+    return directions, cases
+
+
+def narrayStrides(shape: list) -> list:
     """
-        resolve
-        =======
+        narrayStrides
+        =============
 
         Description :
         -------------
-        Resolves n-dimensional maze.
+        Returns the strides of a flattened array of shape shape.
 
         Exemple :
         ---------
-        >>> maze = [[2,1,3], [0,1,0], [0,0,0]]
-        >>> resolve(maze)
-        [(0, 0), (1, 0), (2, 0), (2, 1), (2, 2), (1, 2), (0, 2)]
+        >>> narrayStrides([3, 4, 5])
+        [20, 5, 1]
 
-        maze parameter :
-        ---------------------
-        maze is n-dimensional array of int. \n
-        
-            PATH     = 0
-            WALL     = 1
-            START    = 2
-            END      = 3
-            BANNED   = 4
+        Parameters :
+        ------------
+            shape (list of int): shape of the array.
 
-        Laws parameter :
-        -----------------
-        See newLaw function documentation. \n
-        Laws is a dict of this form : \n
-        {dimensionNumber: law, dimensionNumber: law, ...} \n
-        /!\ WARNING: dimensionNumber begin at 1 not 0. \n
-        If no law is explicit for a dimension, it will by default follow the FREE law. \n
+        Returns:
+        --------
+            list of int: number of cells to skip to move by one unit in each dimension.
+    """
 
-        Availible laws :
-        - FREE
-        - BLOCKED
-        - FORWARD
-        - JUMP_FORWARD (useful for temporal dimensions)
-        - BACKWARD
-        - JUMP_BACKWARD (useful for temporal dimensions)
+    strides = [1] * len(shape)
+    for d in range(len(shape)-2, -1, -1):
+        strides[d] = strides[d+1] * shape[d+1]
+    return strides
 
-        If laws["NO_BAN"] is True => disable banishment of visited cases, useful for temporal dimensions. \n
-        /!\ WARNING : set NO_BAN to True significantly increases temporal complexity.
 
-        Callback parameter :
-        --------------------
-        The callback function is called at each step as well : \n
-        callback({"maze": maze, "laws": laws, "paths": paths}) \n
-        paths is a list of possible correct routes (list of list of tuple of int) \n
-        If the return of callback is a dict with keys "maze", "laws" or "paths" -> the value of the original variable will be modified.
+class _Grid:
+    """
+        _Grid
+        =====
 
-        Parameters :
+        Description :
+        -------------
+        Flat representation of a maze used by the search engines.
+
+        The cells are stored in a single bytearray, surrounded by a layer of WALL
+        in every dimension : a neighbour of a legal cell is always inside the buffer,
+        so neighbour lookups are plain offset arithmetic without bounds checks.
+
+        The engines never write in cells (visited cases are kept in their own buffers),
+        so a grid can be shared by several searches.
+
+        Attributes :
         ------------
-            maze (list): n-dimensional array of int.
-            laws (dict): laws.
-            callback (function): function that executes at each step.
+            shape (tuple of int): shape of the maze.
+            strides (list of int): strides of the padded buffer.
+            cells (bytearray): padded cells.
+    """
 
-        Returns:
-        --------
-            list of tuple of int: path (if the end has not been reached -> return None)
+    def __init__(self, maze: list):
+        self._allocate(narrayShape(maze))
+        self._fill(maze, 0, self.index((0,) * len(self.shape)))
+
+    @classmethod
+    def fromFlat(cls, cases, shape: list):
+        """
+            Builds a grid from the cases of a maze flattened by narrayFlatten (any bytes-like object).
+        """
+
+        grid = cls.__new__(cls)
+        grid._allocate(shape)
+        l = grid.shape[-1]
+        i = 0
+        for row in product(*[range(x) for x in grid.shape[:-1]]):
+            j = grid.index(row + (0,))
+            grid.cells[j:j+l] = cases[i:i+l]
+            i += l
+        return grid
+
+    @classmethod
+    def fromPacked(cls, packed):
+        """
+            Builds a grid from a PackedNarray, row by row (without its FlatNarray).
+        """
+
+        grid = cls.__new__(cls)
+        grid._allocate(packed.shape)
+        l = grid.shape[-1]
+        i = 0
+        for row in product(*[range(x) for x in grid.shape[:-1]]):
+            j = grid.index(row + (0,))
+            grid.cells[j:j+l] = packed._cases(i, l)
+            i += l
+        strides = narrayStrides(grid.shape)
+        for i, v in packed.specials.items():
+            grid.cells[sum((i // s % x + 1) * t for s, x, t in zip(strides, grid.shape, grid.strides))] = v
+        return grid
+
+    def _allocate(self, shape: list) -> None:
+        self.shape = tuple(shape)
+        self.strides = narrayStrides([s+2 for s in self.shape])
+        self.cells = bytearray([WALL]) * (self.strides[0] * (self.shape[0]+2))
+        self._ends = None
+        self._padding = None
+
+    def _fill(self, narray: list, d: int, offset: int) -> None:
+        if d + 1 == len(self.shape): # dernière dimension -> copie la ligne d'un seul bloc
+            self.cells[offset:offset+len(narray)] = _caseBytes(narray)
+            return None
+        for a in narray:
+            self._fill(a, d+1, offset)
+            offset += self.strides[d]
+
+    def index(self, coordinate: tuple) -> int:
+        """
+            Returns the index in cells of a coordinate of the maze.
+        """
+
+        return sum((x+1) * s for x, s in zip(coordinate, self.strides))
+
+    def coordinate(self, index: int) -> tuple:
+        """
+            Returns the coordinate of the maze of an index in cells.
+        """
+
+        c = []
+        for s in self.strides:
+            x, index = divmod(index, s)
+            c.append(x-1)
+        return tuple(c)
+
+    def contains(self, coordinate: tuple) -> bool:
+        """
+            Returns True if coordinate is in the maze.
+        """
+
+        return len(coordinate) == len(self.shape) and all(isLegalCoordinate1D(x, l) for x, l in zip(coordinate, self.shape))
+
+    @property
+    def padding(self) -> bytearray:
+        """
+            1 for the cells of the layer of WALL around the maze, 0 for the cases of the maze (built on first use).
+        """
+
+        if self._padding is None:
+            self._padding = bytearray([1]) * len(self.cells)
+            l = self.shape[-1]
+            for row in product(*[range(x) for x in self.shape[:-1]]):
+                j = self.index(row + (0,))
+                self._padding[j:j+l] = bytes(l)
+        return self._padding
+
+    @property
+    def ends(self) -> list:
+        """
+            Indexes of the exits, found on first use.
+        """
+
+        if self._ends is None:
+            self._ends = []
+            e = self.cells.find(END)
+            while e != -1:
+                self._ends.append(e)
+                e = self.cells.find(END, e+1)
+        return self._ends
+
+
+def _caseBytes(row) -> bytes:
+    """
+        Returns the cases of a row as bytes, values out of 0..255 being read as WALL (like any unknown value).
     """
 
-    paths = [[findStart(maze)]] # creer une list d'un seul chemin contenenant un seul tuple de coordonnées : celles du point de départ
-    end = False
-    while not end: # tant que la sortie n'a pas été trouvée ou que tout les chemins ont été visités
-        arg = callback({"maze": maze, "laws": laws, "paths": paths}) # appel de la fonction callback
-        if type(arg) is dict: # mise à jour potentiel de maze, laws et paths
-            if "maze" in arg: maze = arg["maze"]
-            if "laws" in arg: laws = arg["laws"]
-            if "paths" in arg: paths = arg["paths"]
+    try:
+        return bytes(row)
+    except ValueError:
+        return bytes(v if 0 <= v < 256 else WALL for v in row)
 
-        paths, end = appendPath(paths, maze, laws) # met à jours paths
-        if len(paths) == 0: # si tout les chemins ont été visités et qu'il n'y pas de chemin qui mène à la sortie -> retourne None
-            return None
 
-    return paths
+def _toGrid(maze) -> _Grid:
+    """
+        Returns the _Grid of a maze given as a n-dimensional array, a FlatNarray, a PackedNarray or a _Grid.
+    """
 
+    if isinstance(maze, _Grid):
+        return maze
+    if isinstance(maze, PackedNarray):
+        return _Grid.fromPacked(maze)
+    if isinstance(maze, FlatNarray):
+        return _Grid.fromFlat(maze.cases, maze.shape)
+    return _Grid(maze)
 
-def narrayShape(narray: list):
+
+class _PackedGrid:
     """
-        narrayShape
-        =======
+        _PackedGrid
+        ===========
 
         Description :
         -------------
-        Returns the shape of narray.
+        PackedNarray searched as is by the "bfs" engine (see _searchPacked).
 
-        Exemple :
-        ---------
-        >>> narrayShape([[1,2], [3,4], [4,5]])
-        [3, 2]
+        A case is read from the bitmap and the specials of the maze, there is no
+        padding : indexes are those of narrayFlatten, and the moves that would leave
+        the maze are removed for the cases on its border.
 
-        Parameters :
+        Attributes :
         ------------
-            narray (list): n-dimensional array of int.
-
-        Returns:
-        --------
-            list of int: shape of narray.
+            shape (tuple of int): shape of the maze.
+            strides (list of int): strides of the maze.
+            cells (_PackedGrid): the grid itself, read by index like the cells of a _Grid.
+            ends (list of int): indexes of the exits.
     """
 
-    if type(narray) is not list:
-        return []
-    return [len(narray)] + narrayShape(narray[0])
-    # revient à faire [len(narray), len(narray[0]), len(array[0][0]), ... ]
-    
+    def __init__(self, packed):
+        self.walls = packed.walls
+        self.specials = packed.specials
+        self.shape = packed.shape
+        self.strides = narrayStrides(self.shape)
+        self.cells = self
+        self.ends = sorted(i for i, v in self.specials.items() if v == END)
 
-def narrayFlatten(narray: list):
+    def __getitem__(self, index: int) -> int:
+        v = self.specials.get(index)
+        if v is not None:
+            return v
+        return WALL if self.walls[index >> 3] >> (index & 7) & 1 else PATH
+
+    def __len__(self) -> int:
+        return prod(self.shape)
+
+    def find(self, value: int) -> int:
+        """
+            Returns the first index of a special value (-1 if there is none), like bytearray.find.
+        """
+
+        return min((i for i, v in self.specials.items() if v == value), default=-1)
+
+    def index(self, coordinate: tuple) -> int:
+        """
+            Returns the index of a coordinate of the maze.
+        """
+
+        return sum(x * s for x, s in zip(coordinate, self.strides))
+
+    def coordinate(self, index: int) -> tuple:
+        """
+            Returns the coordinate of the maze of an index.
+        """
+
+        c = []
+        for s in self.strides:
+            x, index = divmod(index, s)
+            c.append(x)
+        return tuple(c)
+
+    def contains(self, coordinate: tuple) -> bool:
+        """
+            Returns True if coordinate is in the maze.
+        """
+
+        return len(coordinate) == len(self.shape) and all(isLegalCoordinate1D(x, l) for x, l in zip(coordinate, self.shape))
+
+
+class MoveSet:
     """
-        narrayFlatten
+        MoveSet
         =======
 
         Description :
         -------------
-        Flattens a n-dimensional array to unidimensional array.
-
-        Exemple :
-        ---------
-        >>> narrayFlatten([[1,2], [3,4], [4,5]])
-        [1, 2, 3, 4, 4, 5]
+        Laws compiled for a given maze shape (see compileLaws function).
 
-        Parameters :
+        Attributes :
         ------------
-            narray (list): n-dimensional array of int.
-
-        Returns:
-        --------
-            list of int: unidimensional array.
+            laws (dict): compiled laws.
+            shape (tuple of int): shape of the mazes the move set applies to.
+            strides (list of int): strides of the padded flat maze (see _Grid).
+            noBan (bool): True if visited cases are not banned.
+            cycles (tuple of int): CYCLIC dimensions (start at 0).
+            deltas (tuple of tuple of int): coordinate differences of the adjacent cells, in the order of getAdjacentCoordinates.
+            offsets (tuple of int): index differences of the adjacent cells in the padded flat maze.
     """
 
-    if type(narray[0]) is not list:
-        return narray
-    fnarray = []
-    for a in narray:
-        fnarray += narrayFlatten(a)
-    return fnarray
+    def __init__(self, laws: dict, shape: tuple):
+        self.laws = dict(laws)
+        self.shape = tuple(shape)
+        self.strides = narrayStrides([s+2 for s in self.shape])
+        self.noBan = bool(self.laws.get("NO_BAN", False))
+        self.cycles = tuple(d for d in range(len(self.shape)) if self.laws.get(d+1) == CYCLIC)
 
+        zero = (0,) * len(self.shape)
+        deltas = getAdjacentCoordinates(zero, self.laws) # la case centrale est en premier
+        if not self.noBan and deltas[0] == zero:
+            deltas = deltas[1:] # la case centrale est toujours bannie (ou le départ) : inutile de la tester
+        self.deltas = tuple(deltas)
+        self.offsets = tuple(sum(x * s for x, s in zip(c, self.strides)) for c in deltas)
 
-def narrayUnflatten(array: list, shape: list):
+
+def compileLaws(laws: dict, shape: list) -> MoveSet:
     """
-        narrayUnlatten
-        ==============
+        compileLaws
+        ===========
 
         Description :
         -------------
-        Gives the desired shape to array.
+        Compiles laws for mazes of a given shape. \n
+        The result can be given to resolve instead of laws : mazes solved
+        many times with the same laws and shape only pay the compilation once.
 
         Exemple :
         ---------
-        >>> narrayUnlatten([1, 2, 3, 4, 4, 5], [3, 2])
-        [[1,2], [3,4], [4,5]]
+        >>> moves = compileLaws({1: JUMP_FORWARD}, [5, 3, 3])
+        >>> moves.deltas
+        ((1, 0, 0), (1, -1, 0), (1, 1, 0), (1, 0, -1), (1, 0, 1))
+        >>> moves = compileLaws({}, [2, 3])
+        >>> resolve([[2,0,0], [1,1,3]], moves)
+        [(0, 0), (0, 1), (0, 2), (1, 2)]
 
         Parameters :
         ------------
-            array (list of int): unidimensional array of int.
-            shape (list of int): the shape to give to array.
+            laws (dict): laws (see newLaw function for details).
+            shape (list of int): shape of the maze (see narrayShape function).
 
         Returns:
         --------
-            list: n-dimensional array of int.
+            MoveSet: compiled laws.
     """
 
-    if len(shape) == 1:
-        return array
-    s = len(array)//shape[0]
-    narray = []
-    for i in range(0, len(array), s):
-        subarray = [array[j] for j in range(i, i+s)]
-        narray.append(narrayUnflatten(subarray, shape[1:]))
-    return narray
+    return MoveSet(laws, shape)
 
 
-def narray2str(narray: list, laws={}) -> str:
+def _resolveGrid(grid: _Grid, start: tuple, moves: MoveSet, reached=None, state=None, budget=None, stats=None) -> list:
+    """
+        Breadth-first search on a _Grid, same results as the appendPath loop of resolve (see _searchGrid).
     """
-        narray2str
-        ==========
 
-        Description :
-        -------------
-        Stringify narray and laws.
+    path = _finish(_searchGrid(grid, start, moves, reached, state, budget, stats), stats)
+    if path is None:
+        return None
+    if stats is None:
+        return list(_pathCoordinates(grid, moves, path))
+    t = time.perf_counter()
+    path = list(_pathCoordinates(grid, moves, path))
+    stats._time("rebuild", time.perf_counter() - t)
+    return path
 
-        Exemple :
-        ---------
-        >>> narray2str([[1, 2],[3, 4],[4, 5]])
-        3:2:
-        0:0:
-        1:2:3:4:4:5:
-        0
 
-        Parameters :
-        ------------
-            narray (list): n-dimensional array of int.
-            laws (dict): laws.
+def _searchPacked(grid: _PackedGrid, start: tuple, moves: MoveSet, reached=None, budget=None, stats=None):
+    """
+        Breadth-first search on a _PackedGrid, as a generator, same events and results as _searchGrid
+        (without NO_BAN nor CYCLIC). The rejected neighbours are counted while the cases are expanded.
+    """
 
-        Returns:
-        --------
-            str: stringified narray and laws.
+    walls, specials = grid.walls, grid.specials
+    ends = set(grid.ends)
+    offsets = tuple(sum(x * s for x, s in zip(c, grid.strides)) for c in moves.deltas)
+    directions = list(enumerate(offsets, 1))
+    # par dimension : pas, dernière coordonnée, déplacements qui en sortent par le bas et par le haut
+    axes = [(s, l - 1, {m for m, c in enumerate(moves.deltas, 1) if c[d] < 0}, {m for m, c in enumerate(moves.deltas, 1) if c[d] > 0})
+            for d, (s, l) in enumerate(zip(grid.strides, grid.shape))]
+    touched = None if reached is None else array("q") # cases marquées dans le tampon donné
+    if reached is None:
+        reached = bytearray(len(grid))
+
+    s = grid.index(start)
+    reached[s] = 255 # le départ n'est jamais revisité (utile s'il n'est pas une case START)
+    frontier = newFrontier = [s]
+    visited = 1
+    stage = 0
+    bounds = blocked = banned = expanded = 0
+    try:
+        while frontier:
+            newFrontier = []
+            for chunk in _chunks(frontier, budget):
+                if chunk is None: # budget épuisé -> chemin vers la case de l'étape la plus proche d'une sortie
+                    n = _closest(grid, moves, frontier)
+                    return None if n is None else _rebuildIndexes(reached, offsets, s, n, None, stats)
+                for n in chunk:
+                    legal = directions
+                    for t, last, low, high in axes: # cases au bord -> retire les déplacements qui sortent
+                        x = n // t % (last + 1)
+                        if x == 0:
+                            legal = [(m, o) for m, o in legal if m not in low]
+                        if x == last:
+                            legal = [(m, o) for m, o in legal if m not in high]
+                    for m, o in legal: # cherche une sortie avant d'étendre le chemin
+                        if n+o in ends:
+                            reached[n+o] = m
+                            newFrontier.append(n+o) # seulement pour effacer sa marque
+                            expanded += 1 # la case qui touche la sortie compte comme étendue, pas ses voisines
+                            return _rebuildIndexes(reached, offsets, s, n+o, None, stats)
+                    expanded += 1
+                    bounds += len(directions) - len(legal)
+                    for m, o in legal:
+                        v = n + o
+                        if walls[v >> 3] >> (v & 7) & 1 or v in specials:
+                            blocked += 1
+                        elif reached[v]:
+                            banned += 1
+                        else:
+                            reached[v] = m
+                            newFrontier.append(v)
+            frontier = newFrontier
+            if touched is not None:
+                touched.extend(frontier)
+            visited += len(frontier)
+            stage += 1
+            yield "layer", stage, len(frontier), visited
+        return None
+    finally:
+        if stats is not None:
+            stats.expanded += expanded
+            stats.rejectedBounds += bounds
+            stats.rejectedWalls += blocked
+            stats.rejectedBanned += banned
+        if touched is not None: # remet à zéro les seules cases marquées
+            reached[s] = 0
+            _clearReached(reached, touched)
+            _clearReached(reached, newFrontier)
+
+
+def _resolvePacked(grid: _PackedGrid, start: tuple, moves: MoveSet, reached=None, budget=None, stats=None) -> list:
+    """
+        Breadth-first search on a _PackedGrid, same results as _resolveGrid (see _searchPacked).
     """
 
-    shape = narrayShape(narray)
-    array = narrayFlatten(narray)
-    ss = sl = sa = ""
-    for d in shape:
-        ss += str(d) + ":"
-    for l in range(len(shape)):
-        if l+1 in laws:
-            sl += str(laws[l+1]) + ":"
-        else:
-            sl += str(FREE) + ":"
-    for v in array:
-        sa += str(v) + ":" 
-    sb = "0"
-    if "NO_BAN" in laws:
-        if laws["NO_BAN"]:
-            sb = "1"
-    return ss + "\n" + sl + "\n" + sa + "\n" + sb
+    path = _finish(_searchPacked(grid, start, moves, reached, budget, stats), stats)
+    if path is None:
+        return None
+    t = time.perf_counter()
+    path = [grid.coordinate(n) for n in path]
+    if stats is not None:
+        stats._time("rebuild", time.perf_counter() - t)
+    return path
 
 
-def str2narray(data: str) -> (list, dict):
+def _finish(search, stats=None) -> list:
+    """
+        Runs a search generator (see _searchGrid) to its end and returns its result.
+        The stages, frontier sizes and visited cases are added to stats.
     """
-        str2narray
-        ==========
 
-        Description :
-        -------------
-        Convert string to n-dimensional array and laws.
+    visited = 1
+    while True:
+        try:
+            event = next(search)
+        except StopIteration as stop:
+            if stats is not None:
+                stats.visited += visited
+            return stop.value
+        if stats is not None:
+            stats.stages += 1
+            stats.peakFrontier = max(stats.peakFrontier, event[2])
+            visited = event[3]
+
+
+def _pathCoordinates(grid: _Grid, moves: MoveSet, path: list):
+    """
+        Yields the coordinates of a path of indexes in cells, with the absolute time in CYCLIC dimensions.
+    """
 
-        Exemple :
-        ---------
-        >>> s = "3:2:\n0:0:\n1:2:3:4:4:5:\0"
-        >>> a, l = str2narray(s)
-        >>> a
-        [[1, 2],[3, 4],[4, 5]]
-        >>> l
-        {1: 0, 2: 0, "NO_BAN": false}
+    t0 = grid.coordinate(path[0])
+    for k, n in enumerate(path):
+        c = grid.coordinate(n)
+        if moves.cycles:
+            c = tuple(t0[d] + k if d in moves.cycles else x for d, x in enumerate(c))
+        yield c
 
-        Parameters :
-        ------------
-            data (str): stringified narray and laws.
 
-        Returns:
-        --------
-            (list, dict): n-dimensional array and laws.
+def _searchGrid(grid: _Grid, start: tuple, moves: MoveSet, reached=None, state=None, budget=None, stats=None):
     """
-
-    data = data.split("\n")
-    shape = [int(x) for x in data[0].split(":")[:-1]]
-    laws = [int(x) for x in data[1].split(":")[:-1]]
-    array = [int(x) for x in data[2].split(":")[:-1]]
-    narray = narrayUnflatten(array, shape)
-    dlaws = {}
-    for l in range(len(laws)):
-        dlaws[l+1] = laws[l]
-    dlaws["NO_BAN"] = int(data[3][0])
-    return narray, dlaws
-        
-def saveNarray(path: str, narray: list, laws={}) -> None:
+        Breadth-first search on a _Grid, as a generator : yields ("layer", stage, frontier size, visited cases)
+        after each stage and returns the path as a list of indexes in cells (None if there is no path).
+
+        Each visited cell only stores the move that reached it (reached[n] is 1 + the index
+        of the offset, 0 if not reached), the path is rebuilt once an END is found.
+        reached is also the set of banned cases, it can be given to reuse a buffer of zeros :
+        the cases marked are then kept, and set back to zero at the end of the search.
+        state is only used with NO_BAN (see _searchGridNoBan).
+        With a budget, the stages are expanded by pieces of budget.every cases (see _chunks).
+        With stats, the neighbours are counted while the cases are expanded (see _Rejections).
     """
-        saveNarray
-        ==========
 
-        Description :
-        -------------
-        Save narray and laws in a file.
+    if moves.noBan:
+        return (yield from _searchGridNoBan(grid, start, moves, reached, state, budget, stats))
+
+    cells = grid.cells
+    offsets = moves.offsets
+    directions = list(enumerate(offsets, 1))
+    touched = None if reached is None else array("q") # cases marquées dans le tampon donné
+    if reached is None:
+        reached = bytearray(len(cells))
+
+    s = grid.index(start)
+    reached[s] = 255 # le départ n'est jamais revisité (utile s'il n'est pas une case START)
+    frontier = newFrontier = [s]
+    visited = 1
+    stage = 0
+    shifts = [] # décalage des déplacements de chaque étape (dimensions CYCLIC)
+    counts = None if stats is None else _Rejections(grid)
+    try:
+        while frontier:
+            if moves.cycles: # toutes les cases d'une étape sont au même instant -> même décalage
+                shifts.append(_cycleShift(grid, moves, start, len(shifts)))
+                directions = [(m, o - shifts[-1]) for m, o in enumerate(offsets, 1)]
+            newFrontier = []
+            for chunk in _chunks(frontier, budget):
+                if chunk is None: # budget épuisé -> chemin vers la case de l'étape la plus proche d'une sortie
+                    n = _closest(grid, moves, frontier)
+                    return None if n is None else _rebuildIndexes(reached, offsets, s, n, shifts[:-1], stats)
+                for n in chunk:
+                    for m, o in directions: # cherche une sortie avant d'étendre le chemin
+                        if cells[n+o] == END:
+                            reached[n+o] = m
+                            newFrontier.append(n+o) # seulement pour effacer sa marque
+                            if counts is not None: # la case qui touche la sortie compte comme étendue, pas ses voisines
+                                counts.expanded += 1
+                            return _rebuildIndexes(reached, offsets, s, n+o, shifts, stats)
+                    if counts is not None:
+                        counts.expanded += 1
+                        for m, o in directions:
+                            if cells[n+o] != PATH:
+                                counts.reject(n+o)
+                            elif reached[n+o]:
+                                counts.banned += 1
+                            else:
+                                reached[n+o] = m
+                                newFrontier.append(n+o)
+                        continue
+                    for m, o in directions:
+                        if cells[n+o] == PATH and not reached[n+o]:
+                            reached[n+o] = m
+                            newFrontier.append(n+o)
+            frontier = newFrontier
+            if touched is not None:
+                touched.extend(frontier)
+            visited += len(frontier)
+            stage += 1
+            yield "layer", stage, len(frontier), visited
+        return None
+    finally:
+        if counts is not None:
+            counts.add(stats)
+        if touched is not None: # remet à zéro les seules cases marquées
+            reached[s] = 0
+            _clearReached(reached, touched)
+            _clearReached(reached, newFrontier)
 
-        Parameters :
-        ------------
-            path (str): file path.
-            narray (list): n-dimensional array.
-            laws (dict): laws.
+
+def _clearReached(reached, marked) -> None:
+    """
+        Sets back to zero the cases of marked in reached.
     """
 
-    stringifiedNArray = narray2str(narray, laws)
-    save = open(path, "w")
-    save.write(stringifiedNArray)
-    save.close()
+    for n in marked:
+        reached[n] = 0
+
 
-def loadNarray(path: str) -> (list, dict):
+def _searchGridNoBan(grid: _Grid, start: tuple, moves: MoveSet, reached=None, state=None, budget=None, stats=None):
     """
-        loadNarray
-        ==========
+        Breadth-first search on a _Grid when NO_BAN is set, as a generator (see _searchGrid).
 
-        Description :
-        -------------
-        Read narray and laws from a file.
+        A cell can be reached several times, so the search stores nodes (cell, parent node)
+        instead : nodes are appended in breadth-first order, a stage is a contiguous range.
+
+        A cell is kept once per stage (reached marks the cells of the next stage) : a later node
+        on the same cell would only repeat the moves of the first one, so the path found is the same.
+        With state, nodes are kept once per state(coordinate, stage) instead, and the search stops
+        after as many stages as the maze has cases (keys can change at every stage, so stages may never repeat).
+    """
+
+    cells = grid.cells
+    offsets = moves.offsets
+    if reached is None:
+        reached = bytearray(len(cells))
+    nodes = array("q", [grid.index(start)]) # case de chaque noeud
+    parents = array("q", [-1]) # noeud parent de chaque noeud
+    seen = None if state is None else {state(start, 0)} # états déjà atteints
+    limit = prod(grid.shape) # nombre d'étapes maximal avec state
+    counts = None if stats is None else _Rejections(grid)
+    repetition = _Repetition()
+
+    def rebuild(i: int) -> list:
+        path = []
+        while i >= 0:
+            path.append(nodes[i])
+            i = parents[i]
+        return path[::-1]
+
+    lo = hi = 0
+    stage = 0
+    try:
+        while lo < len(nodes):
+            hi = len(nodes)
+            if state is None and repetition.check(frozenset(nodes[lo:hi])):
+                return None
+            if state is not None and stage >= limit: # un chemin plus long repasserait par une case
+                return None
+            stage += 1
+            for chunk in _chunks(range(lo, hi), budget):
+                if chunk is None: # budget épuisé -> chemin vers la case de l'étape la plus proche d'une sortie
+                    n = _closest(grid, moves, nodes[lo:hi])
+                    return None if n is None else rebuild(lo + nodes[lo:hi].index(n)) # une case apparaît une seule fois par étape
+                for i in chunk:
+                    n = nodes[i]
+                    for o in offsets:
+                        if cells[n+o] == END:
+                            if counts is not None: # la case qui touche la sortie compte comme étendue, pas ses voisines
+                                counts.expanded += 1
+                            return rebuild(i) + [n+o]
+                    if counts is not None:
+                        counts.expanded += 1
+                    for o in offsets:
+                        if cells[n+o] == PATH:
+                            if state is None:
+                                if reached[n+o]:
+                                    if counts is not None:
+                                        counts.banned += 1
+                                    continue
+                                reached[n+o] = 1
+                            else:
+                                key = state(grid.coordinate(n+o), stage)
+                                if key in seen:
+                                    if counts is not None:
+                                        counts.banned += 1
+                                    continue
+                                seen.add(key)
+                            nodes.append(n+o)
+                            parents.append(i)
+                        elif counts is not None:
+                            counts.reject(n+o)
+            _clearReached(reached, nodes[hi:]) # efface les marques de l'étape suivante
+            lo = hi
+            yield "layer", stage, len(nodes) - lo, len(nodes)
+        return None
+    finally:
+        if counts is not None:
+            counts.add(stats)
+        if state is None and lo != hi: # recherche arrêtée au milieu d'une étape -> efface ses marques
+            _clearReached(reached, nodes[hi:])
+
+
+class _Rejections:
+    """
+        Counts of a "bfs" search with stats, kept while the cases are expanded and added to stats at its end :
+        expanded cases, neighbours out of the maze (padding), walls (any case but PATH and END) and
+        PATH already visited.
+    """
+
+    def __init__(self, grid: _Grid):
+        self.padding = grid.padding
+        self.expanded = self.bounds = self.walls = self.banned = 0
+
+    def reject(self, n: int) -> None:
+        if self.padding[n]:
+            self.bounds += 1
+        else:
+            self.walls += 1
+
+    def add(self, stats) -> None:
+        stats.expanded += self.expanded
+        stats.rejectedBounds += self.bounds
+        stats.rejectedWalls += self.walls
+        stats.rejectedBanned += self.banned
+
+
+def _chunks(frontier, budget):
+    """
+        Yields frontier in one piece without budget. With a budget, yields it by pieces of
+        budget.every cases, spent from the budget before they are expanded, then None once it is exhausted.
+    """
+
+    if budget is None:
+        yield frontier
+        return None
+    for i in range(0, len(frontier), budget.every):
+        chunk = frontier[i:i+budget.every]
+        if budget._spend(len(chunk)):
+            yield None
+            return None
+        yield chunk
+
+
+def _closest(grid: _Grid, moves: MoveSet, frontier) -> int:
+    """
+        Returns the case of frontier closest to an exit according to manhattanHeuristic
+        (the first one in case of a tie), None if no exit can be reached from frontier.
+    """
+
+    heuristic = manhattanHeuristic([grid.coordinate(e) for e in grid.ends], moves.laws)
+    best, closest = inf, None
+    for n in frontier:
+        h = heuristic(grid.coordinate(n))
+        if h < best:
+            best, closest = h, n
+    return closest
+
+
+class _Repetition:
+    """
+        Detects that a stage of a NO_BAN search repeats an earlier one (Brent's algorithm) :
+        a stage only depends on the previous one, so all the next stages would repeat too.
+    """
+
+    def __init__(self):
+        self._saved = None
+        self._power = 1
+        self._length = 0
+
+    def check(self, stage) -> bool:
+        if stage == self._saved:
+            return True
+        self._length += 1
+        if self._length == self._power: # garde une étape toutes les puissances de 2
+            self._saved, self._power, self._length = stage, self._power * 2, 0
+        return False
+
+
+def _rebuildPath(grid: _Grid, reached: bytearray, offsets: tuple, start: int, end: int) -> list:
+    """
+        Rebuilds the path from start to end by following reached backward.
+    """
+
+    return [grid.coordinate(c) for c in _rebuildIndexes(reached, offsets, start, end)]
+
+
+def _rebuildIndexes(reached: bytearray, offsets: tuple, start: int, end: int, shifts=None, stats=None) -> list:
+    """
+        Rebuilds the indexes of the path from start to end by following reached backward.
+        shifts are the shifts of the moves of each stage (see _cycleShift).
+    """
+
+    t = time.perf_counter()
+    path = [end]
+    n = end
+    k = len(shifts) if shifts else 0
+    while n != start:
+        n -= offsets[reached[n]-1]
+        if shifts:
+            k -= 1
+            n += shifts[k]
+        path.append(n)
+    if stats is not None:
+        stats._time("rebuild", time.perf_counter() - t)
+    return path[::-1]
+
+
+def _cycleShift(grid: _Grid, moves: MoveSet, start: tuple, stage: int) -> int:
+    """
+        Returns the index difference to subtract from the moves of a stage of the search from start :
+        a CYCLIC dimension goes back to its first frame after its last one.
+    """
+
+    shift = 0
+    for d in moves.cycles:
+        if (start[d] + stage) % grid.shape[d] == grid.shape[d] - 1:
+            shift += grid.shape[d] * grid.strides[d]
+    return shift
+
+
+def _unwrapCycles(path: list, moves: MoveSet) -> list:
+    """
+        Replaces the coordinates of the CYCLIC dimensions of path by the absolute time.
+    """
+
+    t0 = path[0]
+    return [tuple(t0[d] + k if d in moves.cycles else x for d, x in enumerate(c)) for k, c in enumerate(path)]
+
+
+def _resolveNumpy(grid: _Grid, start: tuple, moves: MoveSet, reached=None) -> list:
+    """
+        Breadth-first search on a _Grid expanding a whole stage at once with numpy.
+
+        The candidates of a stage are ordered like in _resolveGrid (cell of the frontier,
+        then move), so the first one reaching a cell is the same and the path too.
+        A reached buffer given is set back to zero at the end, like in _searchGrid.
+    """
+
+    if numpy is None:
+        raise ImportError("engine \"numpy\" requires numpy")
+
+    cells = numpy.frombuffer(grid.cells, dtype=numpy.uint8) # vue en lecture sur grid.cells, sans copie
+    offsets = numpy.array(moves.offsets, dtype=numpy.int64)
+    m = len(offsets)
+    s = grid.index(start)
+    frontier = numpy.array([s], dtype=numpy.int64)
+    touched = None # cases marquées dans le tampon donné
+    if moves.noBan:
+        stages = [] # (frontière, indice du parent dans la frontière précédente) de chaque étape
+        repetition = _Repetition()
+    elif reached is None:
+        reached = numpy.zeros(len(cells), dtype=numpy.uint8)
+    else:
+        reached = numpy.frombuffer(reached, dtype=numpy.uint8)
+        touched = [frontier]
+    if not moves.noBan:
+        reached[s] = 255
+
+    try:
+        while frontier.size:
+            if moves.noBan and repetition.check(numpy.sort(frontier).tobytes()):
+                return None
+            candidates = (frontier[:, None] + offsets).ravel()
+            values = cells[candidates]
+
+            ends = numpy.flatnonzero(values == END)
+            if ends.size: # la première sortie dans l'ordre des candidats est celle de _resolveGrid
+                i, o = divmod(int(ends[0]), m)
+                end = int(frontier[i]) + moves.offsets[o]
+                if not moves.noBan:
+                    return _rebuildPath(grid, reached, moves.offsets, s, int(frontier[i])) + [grid.coordinate(end)]
+                path = [end, int(frontier[i])]
+                for previous, parents in reversed(stages):
+                    i = int(parents[i])
+                    path.append(int(previous[i]))
+                return [grid.coordinate(c) for c in reversed(path)]
+
+            if moves.noBan:
+                keep = numpy.flatnonzero(values == PATH)
+                _, first = numpy.unique(candidates[keep], return_index=True) # une seule fois chaque case par étape
+                keep = keep[numpy.sort(first)]
+                stages.append((frontier, keep // m))
+            else:
+                keep = numpy.flatnonzero((values == PATH) & (reached[candidates] == 0))
+                _, first = numpy.unique(candidates[keep], return_index=True) # garde le premier candidat de chaque case
+                keep = keep[numpy.sort(first)]
+                reached[candidates[keep]] = keep % m + 1
+            frontier = candidates[keep]
+            if touched is not None:
+                touched.append(frontier)
+        return None
+    finally:
+        if touched is not None: # remet à zéro les seules cases marquées
+            reached[numpy.concatenate(touched)] = 0
+
+
+def _resolveBidirectional(grid: _Grid, start: tuple, moves: MoveSet, reached=None) -> list:
+    """
+        Breadth-first search on a _Grid from the start and from all the exits at the same time.
+
+        The smallest frontier is expanded first, the search stops when the two searches meet.
+        Only valid if every move can be undone (FREE and BLOCKED laws) : otherwise it
+        falls back to _resolveGrid. The moves are kept in dicts of the searched cases (reached is not used).
+    """
+
+    deltas = set(moves.deltas)
+    if moves.noBan or any(tuple(-x for x in d) not in deltas for d in deltas):
+        return _resolveGrid(grid, start, moves, reached) # déplacements irréversibles -> recherche depuis le départ seulement
+
+    cells = grid.cells
+    offsets = moves.offsets
+    directions = list(enumerate(offsets, 1))
+    source = 255 # marque le départ et les sorties dans forward et backward
+    s = grid.index(start)
+    forward = {s: source} # 1 + indice du déplacement qui a atteint la case depuis le départ
+    backward = dict.fromkeys(grid.ends, source) # 1 + indice du déplacement qui a atteint la case depuis une sortie
+    forwardFrontier = [s]
+    backwardFrontier = list(grid.ends)
+
+    meeting = None
+    while forwardFrontier and backwardFrontier and meeting is None:
+        newFrontier = []
+        if len(forwardFrontier) <= len(backwardFrontier):
+            for n in forwardFrontier:
+                for m, o in directions:
+                    v = n+o
+                    if v in backward: # v est une sortie ou a été atteinte depuis une sortie
+                        meeting = n, v
+                        break
+                    if cells[v] == PATH and v not in forward:
+                        forward[v] = m
+                        newFrontier.append(v)
+                if meeting is not None:
+                    break
+            forwardFrontier = newFrontier
+        else:
+            for n in backwardFrontier:
+                for m, o in directions:
+                    v = n+o
+                    if v in forward: # v est le départ ou a été atteinte depuis le départ
+                        meeting = v, n
+                        break
+                    if cells[v] == PATH and v not in backward:
+                        backward[v] = m
+                        newFrontier.append(v)
+                if meeting is not None:
+                    break
+            backwardFrontier = newFrontier
+
+    if meeting is None:
+        return None
+
+    n, v = meeting
+    path = [n]
+    while forward[n] != source:
+        n -= offsets[forward[n]-1]
+        path.append(n)
+    path.reverse()
+    path.append(v)
+    while backward[v] != source:
+        v -= offsets[backward[v]-1]
+        path.append(v)
+    return [grid.coordinate(c) for c in path]
+
+
+def manhattanHeuristic(ends: list, laws={}):
+    """
+        manhattanHeuristic
+        ==================
+
+        Description :
+        -------------
+        Returns the default heuristic of the "astar" engine of resolve : the manhattan
+        distance to the nearest exit, following laws.
+
+        - BLOCKED dimensions contribute zero (exits with another coordinate are unreachable).
+        - FORWARD and BACKWARD dimensions can only reach exits on one side.
+        - JUMP_FORWARD and JUMP_BACKWARD dimensions move at each step, so the distance
+          is at least the number of steps needed in these dimensions.
+
+        The heuristic never overestimates the number of steps left (admissible).
+
+        Exemple :
+        ---------
+        >>> h = manhattanHeuristic([(0, 4), (3, 3)])
+        >>> h((1, 1))
+        4
+
+        Parameters :
+        ------------
+            ends (list of tuple of int): coordinates of the exits (see findEnds function).
+            laws (dict): laws.
+
+        Returns:
+        --------
+            function: heuristic(coordinate) -> number of steps (inf if no exit can be reached).
+    """
+
+    dimension = len(ends[0]) if ends else 0
+    free, forward, backward, jumps, blocked = [], [], [], [], []
+    for d in range(dimension):
+        law = laws.get(d+1, FREE)
+        if law == BLOCKED: blocked.append(d)
+        elif law == FORWARD: forward.append(d)
+        elif law == BACKWARD: backward.append(d)
+        elif law == JUMP_FORWARD: jumps.append((d, 1))
+        elif law == JUMP_BACKWARD: jumps.append((d, -1))
+        else: free.append(d)
+    spatial = free + forward + backward
+
+    def heuristic(c: tuple):
+        best = inf
+        for e in ends:
+            if any(e[d] != c[d] for d in blocked) or any(e[d] < c[d] for d in forward) or any(e[d] > c[d] for d in backward):
+                continue # sortie inatteignable
+            h = sum(abs(e[d] - c[d]) for d in spatial)
+            for d, direction in jumps: # chaque étape fait avancer la dimension d'une unité
+                t = (e[d] - c[d]) * direction
+                h = max(h, t) if t >= 0 else inf
+            if h < best:
+                best = h
+        return best
+
+    return heuristic
+
+
+def _resolveAStar(grid: _Grid, start: tuple, moves: MoveSet, reached=None, heuristic=None, budget=None) -> list:
+    """
+        A* search on a _Grid with a binary heap, returns a path of minimal cost.
+
+        Entering a case costs 1, or w for weighted cases (see WEIGHT).
+        heuristic(coordinate) must never overestimate the cost left to reach an exit,
+        manhattanHeuristic is used by default. Cells are reopened if a shorter path to them is found,
+        so consistent heuristics are not required.
+        With a budget, up to budget.every expansions are spent at once (no more than what is left),
+        the part not expanded is given back at the end of the search.
+        The moves are kept in a dict of the searched cases (reached is not used).
+    """
+
+    cells = grid.cells
+    if heuristic is None:
+        heuristic = manhattanHeuristic([grid.coordinate(e) for e in grid.ends], moves.laws)
+
+    # rester sur place n'est jamais utile pour un plus court chemin (même avec NO_BAN)
+    directions = [(m, o) for m, o in enumerate(moves.offsets, 1) if o != 0]
+    reached = {} # 1 + indice du déplacement qui a atteint chaque case
+    s = grid.index(start)
+    g = {s: 0} # coût depuis le départ
+
+    h = heuristic(start)
+    heap = [(h, 0, s)] # (f, -g, case) : à f égal, la case la plus éloignée du départ d'abord
+    left = 0 # expansions dépensées et pas encore faites
+    try:
+        while heap:
+            f, k, n = heappop(heap)
+            if -k > g[n]: # une meilleure entrée pour cette case a déjà été traitée
+                continue
+            if cells[n] == END:
+                return _rebuildPath(grid, reached, moves.offsets, s, n)
+            if budget is not None:
+                if not left:
+                    spent = budget.every
+                    if budget.maxExpansions is not None: # au plus ce qui reste (au moins 1 pour constater l'épuisement)
+                        spent = max(min(spent, budget.maxExpansions - budget.expansions), 1)
+                    if budget._spend(spent): # budget épuisé -> chemin vers la case ouverte la plus proche d'une sortie (h = f - g)
+                        best = min([(f + k, n)] + [(e[0] + e[1], e[2]) for e in heap if -e[1] == g[e[2]]])
+                        return _rebuildPath(grid, reached, moves.offsets, s, best[1])
+                    left = spent
+                left -= 1
+            for m, o in directions:
+                v = n+o
+                w = _COSTS[cells[v]]
+                if not w:
+                    continue
+                gv = w - k
+                if gv < g.get(v, inf):
+                    h = heuristic(grid.coordinate(v))
+                    if h == inf: # aucune sortie atteignable depuis v
+                        continue
+                    g[v] = gv
+                    reached[v] = m
+                    heappush(heap, (gv + h, -gv, v))
+        return None
+    finally:
+        if left: # rend les expansions dépensées mais pas faites
+            budget.expansions -= left
+
+
+def _resolveDijkstra(grid: _Grid, start: tuple, moves: MoveSet, reached=None, highest=None) -> list:
+    """
+        Dijkstra search on a _Grid, returns a path of minimal cost.
+
+        Entering a case costs 1, or w for weighted cases (see WEIGHT). Costs are small integers,
+        so the queue is a bucket queue (Dial's algorithm) : bucket d % (C+1) holds the cases
+        at distance d, where C is the highest cost of the maze (from highest, the highest
+        value of the cells, computed if None). The moves and distances are kept in dicts of
+        the searched cases (reached is not used).
+    """
+
+    cells = grid.cells
+    directions = [(m, o) for m, o in enumerate(moves.offsets, 1) if o != 0]
+    reached = {} # 1 + indice du déplacement qui a atteint chaque case
+    distances = {}
+    s = grid.index(start)
+
+    if highest is None:
+        highest = max(cells)
+    size = max(1, highest - WEIGHT) + 1 # coût maximal + 1 : une case ne peut pas retomber dans le seau courant
+    buckets = [[] for _ in range(size)]
+    distances[s] = 0
+    buckets[0].append(s)
+    pending = 1 # nombre d'entrées dans les seaux
+    d = 0
+    while pending:
+        bucket = buckets[d % size]
+        while bucket:
+            n = bucket.pop()
+            pending -= 1
+            if distances[n] != d: # entrée obsolète : la case a été atteinte par un chemin moins coûteux
+                continue
+            if cells[n] == END:
+                return _rebuildPath(grid, reached, moves.offsets, s, n)
+            for m, o in directions:
+                v = n+o
+                w = _COSTS[cells[v]]
+                if not w:
+                    continue
+                if d + w < distances.get(v, inf):
+                    distances[v] = d + w
+                    reached[v] = m
+                    buckets[(d + w) % size].append(v)
+                    pending += 1
+        d += 1
+    return None
+
+
+_OPEN = bytes(v in (PATH, END) for v in range(256)) # cases où "jps" peut entrer
+
+
+def _resolveJumpPoint(grid: _Grid, start: tuple, moves: MoveSet, reached=None) -> list:
+    """
+        Jump Point Search on a _Grid (A* on jump points), returns a shortest path.
+
+        Only for FREE laws in every dimension (4 neighbours in 2 dimensions, 2n in n dimensions),
+        otherwise it falls back to _resolveGrid. Weighted cases are walls.
+        Among paths of the same length, only canonical ones are searched : a move in dimension d is
+        followed by a move in d or in a later dimension, or in an earlier dimension i only if the
+        case behind it in i is not free (forced neighbour). Any shortest path can be reordered this way.
+        Straight lines are followed without being expanded (jumps) : they stop on an exit,
+        a forced neighbour, or a case from which a jump in a later dimension stops.
+    """
+
+    dimension = len(grid.shape)
+    if moves.noBan or any(moves.laws.get(d+1, FREE) != FREE for d in range(dimension)):
+        return _resolveGrid(grid, start, moves, reached) # déplacements non uniformes -> recherche en largeur
+    if not grid.ends:
+        return None
+
+    cells = grid.cells
+    axes = [(d, o) for d in range(dimension) for o in (-grid.strides[d], grid.strides[d])]
+    later = [[(i, o) for i, o in axes if i > d] for d in range(-1, dimension)] # later[d+1] : suites naturelles d'un déplacement dans d
+    earlier = {o: [(i, t, t - o) for i, t in axes if i < d] for d, o in axes} # voisins forcés possibles après le déplacement o
+    heuristic = manhattanHeuristic([grid.coordinate(e) for e in grid.ends])
+
+    def jump(n: int, d: int, o: int) -> (int, int):
+        """Follows the move o of dimension d from n, returns the jump point reached (None if none) and its distance."""
+        forced, natural = earlier[o], later[d+1]
+        k = 0
+        while True:
+            n += o
+            k += 1
+            c = cells[n]
+            if c == END:
+                return n, k
+            if c != PATH:
+                return None, k
+            for _, t, behind in forced:
+                if _OPEN[cells[n+t]] and not _OPEN[cells[n+behind]]:
+                    return n, k
+            for i, t in natural: # une ligne dans une dimension suivante mène à un point de saut
+                if jump(n, i, t)[0] is not None:
+                    return n, k
+
+    s = grid.index(start)
+    g = {(s, 0): 0} # coût depuis le départ de chaque (point de saut, déplacement d'arrivée)
+    parents = {(s, 0): None}
+    heap = [(heuristic(start), 0, s, -1, 0)] # (f, -g, case, dimension et déplacement d'arrivée)
+    while heap:
+        f, k, n, d, o = heappop(heap)
+        if -k > g[(n, o)]: # une meilleure entrée pour cet état a déjà été traitée
+            continue
+        if cells[n] == END:
+            path = [n]
+            state = (n, o)
+            while parents[state] is not None:
+                previous = parents[state]
+                n, o = state
+                path.extend(range(n - o, previous[0] - o, -o)) # cases entre deux points de saut
+                state = previous
+            path.reverse()
+            return [grid.coordinate(c) for c in path]
+
+        successors = later[d+1] if not o else [(d, o)] + later[d+1] + [
+            (i, t) for i, t, behind in earlier[o] if _OPEN[cells[n+t]] and not _OPEN[cells[n+behind]]]
+        for i, t in successors:
+            v, w = jump(n, i, t)
+            if v is None:
+                continue
+            gv = w - k
+            if gv < g.get((v, t), inf):
+                g[(v, t)] = gv
+                parents[(v, t)] = (n, o)
+                heappush(heap, (gv + heuristic(grid.coordinate(v)), -gv, v, i, t))
+    return None
+
+
+_shared = {} # mémoire partagée attachée par chaque processus de _resolveParallel
+
+
+def _attachShared(names: list, offsets: tuple, typecode: str) -> None:
+    """
+        Attaches the shared cells, reached and frontier buffers (initializer of the workers of _ParallelSearch).
+    """
+
+    _shared["blocks"] = [shared_memory.SharedMemory(name=name) for name in names]
+    _shared["cells"], _shared["reached"] = _shared["blocks"][0].buf, _shared["blocks"][1].buf
+    _shared["frontier"] = _shared["blocks"][2].buf.cast(typecode)
+    _shared["next"] = _shared["blocks"][3].buf.cast(typecode)
+    _shared["directions"] = list(enumerate(offsets, 1))
+
+
+def _expandFrontier(cells, reached, directions: list, frontier, out, lo: int, hi: int) -> (int, int, int, array):
+    """
+        Expands a part of a stage like _resolveGrid, the new cases are written in out[lo:hi].
+        Returns (position in frontier of the first case next to an END, move to the END, -1 if none),
+        the number of cases written in out, and the cases that did not fit in out[lo:hi].
+    """
+
+    k = lo
+    overflow = array(out.format)
+    for i, n in enumerate(frontier):
+        for m, o in directions: # cherche une sortie avant d'étendre le chemin
+            if cells[n+o] == END:
+                return i, m, k - lo, overflow
+        for m, o in directions:
+            v = n+o
+            if cells[v] == PATH and not reached[v]:
+                reached[v] = m
+                if k < hi:
+                    out[k] = v
+                    k += 1
+                else:
+                    overflow.append(v)
+    return -1, 0, k - lo, overflow
+
+
+def _expandShared(part: tuple) -> (int, int, int, bytes):
+    """
+        Expands the cases frontier[a:b] of the shared frontier in a worker of _ParallelSearch,
+        the new cases are written in the shared next frontier from lo to hi.
+    """
+
+    a, b, lo, hi = part
+    i, m, count, overflow = _expandFrontier(_shared["cells"], _shared["reached"], _shared["directions"],
+                                            _shared["frontier"][a:b], _shared["next"], lo, hi)
+    return i, m, count, overflow.tobytes()
+
+
+def _releaseParallel(pool, views: list, blocks: list) -> None:
+    # arrête les processus puis libère la mémoire partagée (les vues doivent être relâchées avant)
+    pool.shutdown(cancel_futures=True)
+    for view in views:
+        view.release()
+    for block in blocks:
+        block.close()
+        block.unlink()
+
+
+class _ParallelSearch:
+    """
+        Worker processes and shared memory of the "parallel" engine for one _Grid, kept between
+        searches (see Solver class) : the cells are copied once, and the frontiers never leave
+        the shared memory, the workers only receive the bounds of their part.
+
+        Shared blocks : cells and reached (one byte per cell), frontier and next frontier
+        (one index per cell, 4 bytes below 2^31 cells).
+    """
+
+    def __init__(self, grid: _Grid, moves: MoveSet, workers=None):
+        self.grid = grid
+        self.moves = moves
+        self.workers = workers or os.cpu_count() or 1
+        size = len(grid.cells)
+        self._typecode = "i" if size < 2**31 else "q"
+        itemsize = array(self._typecode).itemsize
+        blocks = [shared_memory.SharedMemory(create=True, size=n) for n in (size, size, size * itemsize, size * itemsize)]
+        self._cells, self._reached = blocks[0].buf, blocks[1].buf
+        self._frontier, self._next = blocks[2].buf.cast(self._typecode), blocks[3].buf.cast(self._typecode)
+        self._cells[:size] = grid.cells
+        self._reached[:size] = bytes(size)
+        self._pool = ProcessPoolExecutor(self.workers, initializer=_attachShared,
+                                         initargs=([b.name for b in blocks], moves.offsets, self._typecode))
+        self._release = weakref.finalize(self, _releaseParallel, self._pool,
+                                         [self._cells, self._reached, self._frontier, self._next], blocks)
+
+    def close(self) -> None:
+        """
+            Stops the workers and frees the shared memory.
+        """
+
+        self._release()
+
+    def search(self, start: tuple) -> list:
+        """
+            Breadth-first search from start, each large stage is split between the workers.
+        """
+
+        grid, offsets = self.grid, self.moves.offsets
+        directions = list(enumerate(offsets, 1))
+        frontier, nxt, reached = self._frontier, self._next, self._reached
+        capacity = len(frontier)
+        s = grid.index(start)
+        reached[s] = 255
+        frontier[0] = s
+        length = 1
+        touched = array(self._typecode, [s]) # cases marquées, remises à zéro à la fin
+        end = None
+        try:
+            while length and end is None:
+                if length < _PARALLEL_STAGE * self.workers: # petite étape : pas de communication
+                    parts = [(0, length, 0, capacity)]
+                    results = [_expandFrontier(self._cells, reached, directions, frontier[:length], nxt, 0, capacity)]
+                else:
+                    step = -(-length // self.workers)
+                    slot = capacity // self.workers
+                    parts = [(a, min(a + step, length), k * slot, (k+1) * slot) for k, a in enumerate(range(0, length, step))]
+                    results = [(i, m, count, array(self._typecode, overflow)) for i, m, count, overflow in self._pool.map(_expandShared, parts)]
+
+                for (a, b, lo, hi), (i, m, count, overflow) in zip(parts, results):
+                    if i >= 0: # première partie qui touche une sortie
+                        end = frontier[a+i] + offsets[m-1]
+                        reached[end] = m
+                        touched.append(end)
+                        break
+
+                # la nouvelle frontière est recopiée d'un bloc à l'autre, sans quitter la mémoire partagée
+                length = sum(count + len(overflow) for _, _, count, overflow in results)
+                if length > capacity: # une case atteinte par plusieurs parties en même temps peut être en double
+                    cases = array(self._typecode, dict.fromkeys(c for (_, _, lo, _), (_, _, count, overflow) in zip(parts, results) for c in list(nxt[lo:lo+count]) + list(overflow)))
+                    length = len(cases)
+                    frontier[:length] = memoryview(cases)
+                else:
+                    j = 0
+                    for (_, _, lo, _), (_, _, count, overflow) in zip(parts, results):
+                        frontier[j:j+count] = nxt[lo:lo+count]
+                        j += count
+                        frontier[j:j+len(overflow)] = memoryview(overflow)
+                        j += len(overflow)
+                touched.frombytes(frontier[:length].tobytes())
+            return None if end is None else _rebuildPath(grid, reached, offsets, s, end)
+        finally:
+            _clearReached(reached, touched)
+
+
+def _resolveParallel(grid: _Grid, start: tuple, moves: MoveSet, reached=None, workers=None, search=None) -> list:
+    """
+        Breadth-first search on a _Grid where each stage is split between worker processes (see _ParallelSearch).
+
+        The parts of a stage are expanded at the same time, then the first part that touches an END
+        gives the path : it is still the first END reached, and a shortest path. When two parts reach
+        the same case, any of the two moves can be kept, so the path may differ from "bfs" among the
+        paths of the same length. Small stages are expanded by the calling process.
+        search is kept by a Solver between its searches, otherwise the workers are started for this search only.
+        Mazes of less than _PARALLEL_CASES cases, NO_BAN and CYCLIC dimensions fall back to _resolveGrid.
+    """
+
+    if moves.noBan or moves.cycles or prod(grid.shape) < _PARALLEL_CASES:
+        return _resolveGrid(grid, start, moves, reached)
+    if search is not None:
+        return search.search(start)
+    search = _ParallelSearch(grid, moves, workers)
+    try:
+        return search.search(start)
+    finally:
+        search.close()
+
+
+_ENGINES = {
+    "bfs": _resolveGrid,
+    "numpy": _resolveNumpy,
+    "bidirectional": _resolveBidirectional,
+    "astar": _resolveAStar,
+    "dijkstra": _resolveDijkstra,
+    "jps": _resolveJumpPoint,
+    "parallel": _resolveParallel,
+}
+
+
+class Budget:
+    """
+        Budget
+        ======
+
+        Description :
+        -------------
+        Limits the time and the work of searches (see resolve function). \n
+        When the budget runs out, the search stops and returns a best-effort path : the path
+        to the case of its frontier closest to an exit (manhattanHeuristic), and exhausted
+        tells why it stopped. The same budget can be shared by several searches
+        (one request of a server for example) : expansions add up.
+
+        Cases are spent by pieces of at most every cases : the limits are checked before
+        each piece, and hook is called each time every more cases have been expanded.
+
+        Exemple :
+        ---------
+        >>> budget = Budget(maxExpansions=2, every=1)
+        >>> resolve([[2,0,0,0,0,3]], budget=budget)
+        [(0, 0), (0, 1), (0, 2)]
+        >>> budget.exhausted
+        'expansions'
+
+        Parameters :
+        ------------
+            deadline (float): time.monotonic() value after which searches stop.
+            maxExpansions (int): number of cases searches can expand.
+            hook (function): hook(budget) called every every expansions, returning True cancels the search.
+            every (int): number of expansions between two checks.
+
+        Attributes :
+        ------------
+            expansions (int): number of cases expanded so far.
+            cancelled (bool): True once cancel has been called.
+            exhausted (str): why the last search stopped early ("cancelled", "expansions" or "deadline"),
+            None if it ended normally.
+    """
+
+    def __init__(self, deadline=None, maxExpansions=None, hook=None, every=1024):
+        if every < 1:
+            raise ValueError("every must be at least 1")
+        self.deadline = deadline
+        self.maxExpansions = maxExpansions
+        self.hook = hook
+        self.every = every
+        self.expansions = 0
+        self.cancelled = False
+        self.exhausted = None
+
+    def cancel(self) -> None:
+        """
+            Stops the searches using the budget at their next check (can be called from another thread).
+        """
+
+        self.cancelled = True
+
+    def _spend(self, n: int) -> bool:
+        # appelée par les moteurs avant d'étendre n cases, retourne True si la recherche doit s'arrêter
+        if self.hook is not None and (self.expansions + n) // self.every > self.expansions // self.every:
+            if self.hook(self):
+                self.cancelled = True
+        if self.cancelled:
+            self.exhausted = "cancelled"
+        elif self.maxExpansions is not None and self.expansions + n > self.maxExpansions:
+            self.exhausted = "expansions"
+        elif self.deadline is not None and time.monotonic() >= self.deadline:
+            self.exhausted = "deadline"
+        else:
+            self.expansions += n
+        return self.exhausted is not None
+
+
+class SearchStats:
+    """
+        SearchStats
+        ===========
+
+        Description :
+        -------------
+        Counters and timers of searches (see resolve function), to find out where the time of a search goes. \n
+        Given to resolve or Solver.solve, the search is followed more closely (and a bit slower) : without
+        stats, nothing is counted. Counts add up over the searches using the same stats (see reset).
+
+        Exemple :
+        ---------
+        >>> stats = SearchStats()
+        >>> resolve([[2,1,3], [0,1,0], [0,0,0]], stats=stats)
+        [(0, 0), (1, 0), (2, 0), (2, 1), (2, 2), (1, 2), (0, 2)]
+        >>> stats.expanded, stats.visited, stats.rejectedWalls
+        (6, 6, 4)
+        >>> stats.log(logging.getLogger("pathfinder"))
+
+        Attributes :
+        ------------
+            searches (int): number of searches.
+            expanded (int): cases whose neighbours have been examined.
+            stages (int): finished stages (breadth-first searches).
+            peakFrontier (int): largest number of cases of a stage.
+            visited (int): cases reached, starting points included.
+            rejectedBounds (int): neighbours out of the maze.
+            rejectedWalls (int): neighbours that are neither PATH nor END (walls, weighted cases, ...).
+            rejectedBanned (int): PATH neighbours already visited (banned).
+            timers (dict): seconds spent by phase : "search" (whole searches, counting included) and "rebuild"
+            (path reconstruction). Only the callback loop of resolve also times "adjacents" (getAdjacents),
+            "lookup" (getCases) and "copy" (copies of the paths) : the engines count while they expand,
+            timing each neighbour would cost more than the search itself.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        """
+            Sets all the counters and timers to zero.
+        """
+
+        self.searches = 0
+        self.expanded = 0
+        self.stages = 0
+        self.peakFrontier = 0
+        self.visited = 0
+        self.rejectedBounds = 0
+        self.rejectedWalls = 0
+        self.rejectedBanned = 0
+        self.timers = {}
+
+    def _time(self, phase: str, seconds: float) -> None:
+        self.timers[phase] = self.timers.get(phase, 0) + seconds
+
+    def asDict(self) -> dict:
+        """
+            Returns the counters and the timers ("time.search", "time.rebuild", ...) in a flat dict.
+        """
+
+        d = {k: v for k, v in vars(self).items() if k != "timers"}
+        d.update(("time." + k, v) for k, v in self.timers.items())
+        return d
+
+    def log(self, logger=None, level=logging.INFO) -> None:
+        """
+            Writes the stats in one line to logger (the "pathfinder" logger by default).
+        """
+
+        logger = logging.getLogger("pathfinder") if logger is None else logger
+        logger.log(level, "search stats: %s", " ".join("%s=%s" % (k, round(v, 6) if type(v) is float else v) for k, v in self.asDict().items()))
+
+    def export(self, sink, prefix="pathfinder.") -> None:
+        """
+            Calls sink(name, value) for each counter and timer (a gauge of a metrics client for example).
+        """
+
+        for k, v in self.asDict().items():
+            sink(prefix + k, v)
+
+
+def defaultCallback(arg: {}) -> None:
+    """
+        Does nothing ( °_°')
+    """
+
+    # cette fonction est une fonction inutile utilisée comme fonction par défaut dans resolve()
+    return None
+
+
+def resolve(maze: list, laws={}, callback=defaultCallback, engine="bfs", heuristic=None, workers=None, state=None, budget=None, stats=None) -> list:
+    """
+        resolve
+        =======
+
+        Description :
+        -------------
+        Resolves n-dimensional maze.
+
+        Exemple :
+        ---------
+        >>> maze = [[2,1,3], [0,1,0], [0,0,0]]
+        >>> resolve(maze)
+        [(0, 0), (1, 0), (2, 0), (2, 1), (2, 2), (1, 2), (0, 2)]
+
+        maze parameter :
+        ---------------------
+        maze is n-dimensional array of int (or a FlatNarray, a PackedNarray or a LazyNarray). \n
+        
+            PATH     = 0
+            WALL     = 1
+            START    = 2
+            END      = 3
+            BANNED   = 4
+            WEIGHT + w (1 <= w <= 245) : weighted path
+
+        Weighted cases cost w instead of 1 to walk into. Only the "dijkstra" and "astar"
+        engines read weights and return a path of minimal total cost, the other engines
+        consider weighted cases as walls. Any other value (negative or above 255 included) is a wall.
+
+        Laws parameter :
+        -----------------
+        See newLaw function documentation. \n
+        Laws can also be a MoveSet returned by compileLaws. \n
+        Laws is a dict of this form : \n
+        {dimensionNumber: law, dimensionNumber: law, ...} \n
+        /!\ WARNING: dimensionNumber begin at 1 not 0. \n
+        If no law is explicit for a dimension, it will by default follow the FREE law. \n
+
+        Availible laws :
+        - FREE
+        - BLOCKED
+        - FORWARD
+        - JUMP_FORWARD (useful for temporal dimensions)
+        - BACKWARD
+        - JUMP_BACKWARD (useful for temporal dimensions)
+        - CYCLIC (periodic temporal dimensions, see resolve function)
+
+        If laws["NO_BAN"] is True => disable banishment of visited cases, useful for temporal dimensions. \n
+        /!\ WARNING : set NO_BAN to True increases temporal complexity. \n
+        A case can then be visited again at a later stage, but only the first path reaching a case at
+        a given stage is extended (the others would only repeat its moves), so a stage has at most
+        one path per case. The search stops when a stage repeats an earlier one. \n
+        With the "bfs" engine, the state parameter can replace this rule : state(coordinate, stage)
+        returns a hashable key and only the first path reaching each key is extended. The search then
+        stops when no new key is reached, or after as many stages as the maze has cases.
+
+        A CYCLIC dimension is a time dimension that holds a single period of the maze :
+        its coordinate is incremented at each step (like JUMP_FORWARD) and goes back to 0
+        after the last frame. The search stays finite however long the path is, since a case
+        is visited at most once per frame of the period. In the returned path, the coordinate
+        of a CYCLIC dimension is the absolute time (the case is at time % period). \n
+        Only the "bfs" engine without callback supports CYCLIC dimensions, without NO_BAN.
+
+        Callback parameter :
+        --------------------
+        The callback function is called at each step as well : \n
+        callback({"maze": maze, "laws": laws, "paths": paths}) \n
+        paths is a list of possible correct routes (list of list of tuple of int) \n
+        If the return of callback is a dict with keys "maze", "laws" or "paths" -> the value of the original variable will be modified.
+
+        maze is never modified by resolve : visited cases are kept apart, so the same maze can be solved again.
+
+        Budget parameter :
+        ------------------
+        Without callback, a Budget limits the time and the number of expanded cases of the search
+        ("bfs" and "astar" engines) and can cancel it. Its hook is called every budget.every expansions
+        instead of a callback at each step. When the budget runs out, resolve returns the path to the
+        case of the frontier closest to an exit (see Budget class).
+
+        Engine parameter :
+        ------------------
+        Search engine used when there is no callback : \n
+        - "bfs" (default)
+        - "numpy" (expands a whole stage at once with numpy arrays, faster on wide open mazes, requires numpy)
+        - "bidirectional" (searches from the start and from the exits at the same time, only with FREE and BLOCKED laws,
+          otherwise falls back to "bfs")
+        - "astar" (A* search, expands far less cases when the exits are in an obvious direction)
+        - "dijkstra" (minimal cost path, see weighted cases)
+        - "jps" (Jump Point Search, expands only the cases where a shortest path may turn, much less than "bfs"
+          on open mazes, only with FREE laws, otherwise falls back to "bfs")
+        - "parallel" (splits each stage of "bfs" between worker processes, for huge mazes : below _PARALLEL_CASES
+          cases (2^19), with NO_BAN or CYCLIC dimensions, falls back to "bfs". A Solver keeps its processes between searches)
+
+        The "astar" engine uses manhattanHeuristic by default, another heuristic can be given
+        with the heuristic parameter : heuristic(coordinate) must return a number of steps
+        that never overestimates the number of steps left to reach an exit.
+
+        "bfs" and "numpy" return the same path. The other engines also return a shortest path,
+        but may choose another one when several paths have the same length.
+
+        Parameters :
+        ------------
+            maze (list, FlatNarray or PackedNarray): n-dimensional array of int.
+            laws (dict or MoveSet): laws.
+            callback (function): function that executes at each step.
+            engine (str): search engine.
+            heuristic (function): heuristic of the "astar" engine.
+            workers (int): number of processes of the "parallel" engine (number of CPUs by default).
+            state (function): state of the "bfs" engine with NO_BAN.
+            budget (Budget): limits of the search ("bfs" and "astar" engines, see Budget class).
+            stats (SearchStats): counters and timers of the search ("bfs" engine, see SearchStats class).
+
+        Returns:
+        --------
+            list of tuple of int: path (if the end has not been reached -> return None)
+    """
+
+    if isinstance(maze, LazyNarray): # cases calculées à la demande -> recherche sur les seules cases visitées
+        if callback is not defaultCallback or engine != "bfs" or state is not None or budget is not None or stats is not None:
+            raise ValueError("a LazyNarray can only be solved by the \"bfs\" engine without callback, state, budget nor stats")
+        if not isinstance(laws, MoveSet):
+            laws = compileLaws(laws, maze.shape)
+        elif laws.shape != tuple(maze.shape):
+            raise ValueError("laws compiled for shape %s, maze has shape %s" % (laws.shape, tuple(maze.shape)))
+        if laws.cycles and laws.noBan:
+            raise ValueError("CYCLIC dimensions are only supported without NO_BAN")
+        return _resolveLazy(maze, laws)
+
+    if callback is defaultCallback: # sans callback, le labyrinthe ne change pas pendant la résolution -> représentation plate
+        with Solver(maze, laws, engine, heuristic, workers, state) as solver: # arrête les processus du moteur "parallel"
+            return solver.solve(budget=budget, stats=stats)
+
+    if isinstance(laws, MoveSet): # lois déjà compilées
+        laws = laws.laws
+    if CYCLIC in laws.values():
+        raise ValueError("CYCLIC dimensions are only supported without callback")
+    if budget is not None:
+        raise ValueError("budget is only supported without callback")
+    if stats is not None and engine != "bfs":
+        raise ValueError("stats are only collected by the \"bfs\" engine")
+    if isinstance(maze, (FlatNarray, PackedNarray)): # le callback reçoit et peut modifier un tableau à n dimensions
+        maze = maze.toNarray()
+    visited = set() # cases bannies, gardées à part pour ne pas modifier maze
+    paths = [[findStart(maze)]] # creer une list d'un seul chemin contenenant un seul tuple de coordonnées : celles du point de départ
+    if stats is not None:
+        stats.searches += 1
+        stats.visited += 1
+        t = time.perf_counter()
+    end = False
+    repetition = _Repetition() # avec NO_BAN, arrête la recherche quand une étape en répète une autre
+    while not end: # tant que la sortie n'a pas été trouvée ou que tout les chemins ont été visités
+        arg = callback({"maze": maze, "laws": laws, "paths": paths}) # appel de la fonction callback
+        if type(arg) is dict: # mise à jour potentiel de maze, laws et paths
+            if "maze" in arg: maze = arg["maze"]
+            if "laws" in arg: laws = arg["laws"]
+            if "paths" in arg: paths = arg["paths"]
+            repetition = _Repetition() # les étapes précédentes ne valent plus pour la suite
+        if laws.get("NO_BAN", False) and repetition.check(frozenset(p[-1] for p in paths)):
+            return None
+
+        paths, end = appendPath(paths, maze, laws, visited, stats) # met à jours paths
+        if stats is not None:
+            if not end:
+                stats.stages += 1
+                stats.visited += len(paths)
+                stats.peakFrontier = max(stats.peakFrontier, len(paths))
+            stats._time("search", time.perf_counter() - t)
+            t = time.perf_counter()
+        if len(paths) == 0: # si tout les chemins ont été visités et qu'il n'y pas de chemin qui mène à la sortie -> retourne None
+            return None
+
+    return paths
+
+
+def iresolve(maze: list, laws={}, start=None, state=None, budget=None):
+    """
+        iresolve
+        ========
+
+        Description :
+        -------------
+        Resolves n-dimensional maze like resolve with the "bfs" engine, as a generator of search events :
+
+        - ("layer", stage, frontier, visited) when a stage is finished : number of cases of the next stage
+          and number of cases visited so far.
+        - ("end", coordinates, length) when an exit is found : coordinates of the exit and number of cases of the path.
+          ("partial", coordinates, length) instead if the budget runs out (see Budget class).
+        - ("cell", coordinates) for each case of the path, from the starting point to the exit.
+
+        Nothing follows the last "layer" event if there is no path. The search is paused between two events,
+        and the coordinates of the path are only computed when its cells are read.
+
+        Exemple :
+        ---------
+        >>> for event in iresolve([[2,1,3], [0,1,0], [0,0,0]]):
+        ...     print(event)
+        ('layer', 1, 1, 2)
+        ('layer', 2, 1, 3)
+        ('layer', 3, 1, 4)
+        ('layer', 4, 1, 5)
+        ('layer', 5, 1, 6)
+        ('end', (0, 2), 7)
+        ('cell', (0, 0))
+        ('cell', (1, 0))
+        ('cell', (2, 0))
+        ('cell', (2, 1))
+        ('cell', (2, 2))
+        ('cell', (1, 2))
+        ('cell', (0, 2))
+
+        Parameters :
+        ------------
+            maze (list, FlatNarray or PackedNarray): n-dimensional array of int.
+            laws (dict or MoveSet): laws.
+            start (tuple of int): coordinates of the starting point (the START case of the maze by default).
+            state (function): state of the search with NO_BAN (see resolve function).
+            budget (Budget): limits of the search (see Budget class).
+
+        Returns:
+        --------
+            iterator of tuple: search events.
+    """
+
+    solver = Solver(maze, laws, state=state)
+    grid = solver._grid
+    start = solver.start if start is None else tuple(start)
+    if start is None:
+        return None
+    if not grid.contains(start):
+        raise ValueError("starting point %s is not in the maze of shape %s" % (start, solver.shape))
+    if budget is not None:
+        budget.exhausted = None
+
+    if grid.cells[grid.index(start)] == END:
+        path = [grid.index(start)]
+    else:
+        if isinstance(grid, _PackedGrid):
+            path = yield from _searchPacked(grid, start, solver.moves, None, budget)
+        else:
+            path = yield from _searchGrid(grid, start, solver.moves, None, state, budget)
+        if path is None:
+            return None
+    end = grid.coordinate(path[-1])
+    if solver.moves.cycles: # temps absolu, comme le dernier événement "cell"
+        t0 = grid.coordinate(path[0])
+        end = tuple(t0[d] + len(path) - 1 if d in solver.moves.cycles else x for d, x in enumerate(end))
+    yield "end" if grid.cells[path[-1]] == END else "partial", end, len(path)
+    for c in _pathCoordinates(grid, solver.moves, path):
+        yield "cell", c
+
+
+class Solver:
+    """
+        Solver
+        ======
+
+        Description :
+        -------------
+        Solves the same maze from many starting points. \n
+        The maze is flattened, the laws compiled and the exits found once,
+        then each query only pays for its own search.
+
+        Exemple :
+        ---------
+        >>> solver = Solver([[2,1,3], [0,1,0], [0,0,0]])
+        >>> solver.solve()
+        [(0, 0), (1, 0), (2, 0), (2, 1), (2, 2), (1, 2), (0, 2)]
+        >>> solver.solve((2, 1))
+        [(2, 1), (2, 2), (1, 2), (0, 2)]
+        >>> list(solver.solveMany([(1, 2), (2, 0)]))
+        [[(1, 2), (0, 2)], [(2, 0), (2, 1), (2, 2), (1, 2), (0, 2)]]
+
+        With the "parallel" engine, the worker processes and the shared memory are started once and
+        kept between the searches : close the solver (or use it in a with block) to stop them.
+
+        Parameters :
+        ------------
+            maze (list, FlatNarray or PackedNarray): n-dimensional array of int.
+            laws (dict or MoveSet): laws.
+            engine (str): search engine (see resolve function for details).
+            heuristic (function): heuristic of the "astar" engine.
+            workers (int): number of processes of the "parallel" engine.
+            state (function): state of the "bfs" engine with NO_BAN.
+
+        Attributes :
+        ------------
+            shape (tuple of int): shape of the maze.
+            moves (MoveSet): compiled laws.
+            engine (str): search engine.
+            start (tuple of int): coordinates of the starting point of the maze (None if there is no START).
+    """
+
+    def __init__(self, maze: list, laws={}, engine="bfs", heuristic=None, workers=None, state=None):
+        if engine not in _ENGINES:
+            raise ValueError("unknown engine %r, availible engines : %s" % (engine, ", ".join(_ENGINES)))
+        if heuristic is not None and engine != "astar":
+            raise ValueError("heuristic is only used by the \"astar\" engine")
+        if workers is not None and engine != "parallel":
+            raise ValueError("workers is only used by the \"parallel\" engine")
+
+        self._grid = _PackedGrid(maze) if isinstance(maze, PackedNarray) else _toGrid(maze)
+        self.shape = self._grid.shape
+        if not isinstance(laws, MoveSet):
+            laws = compileLaws(laws, self.shape)
+        elif laws.shape != self.shape:
+            raise ValueError("laws compiled for shape %s, maze has shape %s" % (laws.shape, self.shape))
+        self.moves = laws
+        if isinstance(self._grid, _PackedGrid) and (engine != "bfs" or self.moves.noBan or self.moves.cycles):
+            self._grid = _toGrid(maze) # bitmap lu tel quel par le seul moteur "bfs" sans NO_BAN ni CYCLIC
+        if self.moves.cycles and (engine != "bfs" or self.moves.noBan):
+            raise ValueError("CYCLIC dimensions are only supported by the \"bfs\" engine, without NO_BAN")
+        if state is not None and (engine != "bfs" or not self.moves.noBan):
+            raise ValueError("state is only used by the \"bfs\" engine with NO_BAN")
+
+        self.engine = engine
+        self._engine = _ENGINES[engine]
+        if engine == "astar":
+            if heuristic is None:
+                heuristic = manhattanHeuristic([self._grid.coordinate(e) for e in self._grid.ends], self.moves.laws)
+            self._engine = partial(_resolveAStar, heuristic=heuristic)
+        if engine == "dijkstra":
+            self._engine = partial(_resolveDijkstra, highest=max(self._grid.cells))
+        self._parallel = None
+        if engine == "parallel":
+            if not self.moves.noBan and prod(self.shape) >= _PARALLEL_CASES: # processus et mémoire partagée gardés d'une recherche à l'autre
+                self._parallel = _ParallelSearch(self._grid, self.moves, workers)
+            self._engine = partial(_resolveParallel, workers=workers, search=self._parallel)
+        if state is not None:
+            self._engine = partial(_resolveGrid, state=state)
+        if isinstance(self._grid, _PackedGrid):
+            self._engine = _resolvePacked
+
+        start = self._grid.cells.find(START)
+        self.start = None if start == -1 else self._grid.coordinate(start)
+        self._reached = bytearray(len(self._grid.cells)) # réutilisé d'une recherche à l'autre, remis à zéro par les moteurs
+
+    def solve(self, start=None, budget=None, stats=None) -> list:
+        """
+            solve
+            =====
+
+            Description :
+            -------------
+            Returns the shortest path from start to an exit (None if there is no path).
+
+            Parameters :
+            ------------
+                start (tuple of int): coordinates of the starting point (the START case of the maze by default).
+                budget (Budget): limits of the search ("bfs" and "astar" engines, see Budget class).
+                stats (SearchStats): counters and timers of the search ("bfs" engine, see SearchStats class).
+
+            Returns:
+            --------
+                list of tuple of int: path (best-effort path if the budget runs out).
+        """
+
+        if start is None:
+            start = self.start
+            if start is None:
+                return None
+        start = tuple(start)
+        if not self._grid.contains(start):
+            raise ValueError("starting point %s is not in the maze of shape %s" % (start, self.shape))
+        if stats is not None and self.engine != "bfs":
+            raise ValueError("stats are only collected by the \"bfs\" engine")
+        options = {}
+        if budget is not None:
+            if self.engine not in ("bfs", "astar"):
+                raise ValueError("budget is only used by the \"bfs\" and \"astar\" engines")
+            budget.exhausted = None
+            options["budget"] = budget
+        if self._grid.cells[self._grid.index(start)] == END:
+            return [start]
+        if stats is not None:
+            stats.searches += 1
+            options["stats"] = stats
+            t = time.perf_counter()
+        try:
+            return self._engine(self._grid, start, self.moves, self._reached, **options)
+        finally:
+            if stats is not None:
+                stats._time("search", time.perf_counter() - t)
+
+    def solveMany(self, starts):
+        """
+            solveMany
+            =========
+
+            Description :
+            -------------
+            Yields the shortest path from each starting point, in the order of starts.
+
+            Parameters :
+            ------------
+                starts (iterable of tuple of int): coordinates of the starting points.
+
+            Returns:
+            --------
+                iterator of list of tuple of int: paths (None if there is no path).
+        """
+
+        for start in starts:
+            yield self.solve(start)
+
+    def close(self) -> None:
+        """
+            Stops the worker processes of the "parallel" engine and frees their shared memory
+            (also done when the solver is garbage collected, or at the end of a with block).
+        """
+
+        if self._parallel is not None:
+            self._parallel.close()
+            self._engine = partial(_resolveParallel, workers=self._parallel.workers) # processus démarrés à chaque recherche
+            self._parallel = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class Planner:
+    """
+        Planner
+        =======
+
+        Description :
+        -------------
+        Solves a maze that changes a few cases at a time (D* Lite). \n
+        The planner keeps its own copy of the maze and the cost to reach an exit from the
+        cases it explored : after updateCells, solve only repairs the costs that changed,
+        far faster than solving again from scratch. The starting point can also move. \n
+        Weighted cases are read (see resolve function) : the path has a minimal total cost,
+        the number of steps for mazes without weights.
+
+        Exemple :
+        ---------
+        >>> planner = Planner([[2,1,3], [0,1,0], [0,0,0]])
+        >>> planner.solve()
+        [(0, 0), (1, 0), (2, 0), (2, 1), (2, 2), (1, 2), (0, 2)]
+        >>> planner.updateCells({(0, 1): PATH})
+        >>> planner.solve()
+        [(0, 0), (0, 1), (0, 2)]
+
+        Parameters :
+        ------------
+            maze (list, FlatNarray or PackedNarray): n-dimensional array of int (never modified).
+            laws (dict or MoveSet): laws (NO_BAN and CYCLIC are not supported).
+
+        Attributes :
+        ------------
+            shape (tuple of int): shape of the maze.
+            moves (MoveSet): compiled laws.
+            start (tuple of int): coordinates of the starting point (None if there is no START).
+    """
+
+    def __init__(self, maze: list, laws={}):
+        self._grid = _toGrid(maze)
+        self.shape = self._grid.shape
+        if not isinstance(laws, MoveSet):
+            laws = compileLaws(laws, self.shape)
+        elif laws.shape != self.shape:
+            raise ValueError("laws compiled for shape %s, maze has shape %s" % (laws.shape, self.shape))
+        if laws.noBan or laws.cycles:
+            raise ValueError("Planner does not support NO_BAN nor CYCLIC dimensions")
+        self.moves = laws
+        self._jumps = [d for d in range(len(self.shape)) if laws.laws.get(d+1) in (JUMP_FORWARD, JUMP_BACKWARD)]
+
+        start = self._grid.cells.find(START)
+        self.start = None if start == -1 else self._grid.coordinate(start)
+        self._last = None # départ de la dernière recherche
+        self._km = 0 # somme des distances parcourues par le départ (clés de D* Lite)
+        self._g = {} # coût pour atteindre une sortie (inf si absent)
+        self._rhs = {} # coût prévu d'après les cases suivantes (inf si absent)
+        self._open = {} # clé des cases de la file
+        self._heap = []
+        for e in self._grid.ends:
+            self._rhs[e] = 0
+            self._push(e)
+
+    def _steps(self, a: int, b: int) -> int:
+        # nombre minimal d'étapes entre deux cases : les dimensions JUMP avancent à chaque étape,
+        # les autres dimensions changent d'une unité au plus par étape
+        a, b = self._grid.coordinate(a), self._grid.coordinate(b)
+        jumps = max((abs(a[d] - b[d]) for d in self._jumps), default=0)
+        return max(jumps, sum(abs(x - y) for d, (x, y) in enumerate(zip(a, b)) if d not in self._jumps))
+
+    def _key(self, n: int) -> tuple:
+        m = min(self._g.get(n, inf), self._rhs.get(n, inf))
+        return (m + self._steps(self._last, n) + self._km, m) if self._last is not None else (m, m)
+
+    def _push(self, n: int) -> None:
+        key = self._key(n)
+        self._open[n] = key
+        heappush(self._heap, key + (n,))
+
+    def _update(self, n: int) -> None:
+        cells = self._grid.cells
+        if cells[n] != END:
+            best = inf
+            for o in self.moves.offsets:
+                cost = _COSTS[cells[n+o]]
+                if cost:
+                    best = min(best, cost + self._g.get(n+o, inf))
+            self._rhs[n] = best
+        else:
+            self._rhs[n] = 0
+        if self._g.get(n, inf) != self._rhs[n]:
+            self._push(n)
+        else:
+            self._open.pop(n, None)
+
+    def _predecessors(self, n: int):
+        # cases depuis lesquelles on entre dans n (le départ même s'il n'est pas un chemin)
+        cells = self._grid.cells
+        for o in self.moves.offsets:
+            p = n - o
+            if _COSTS[cells[p]] or p == self._last:
+                yield p
+
+    def _compute(self) -> None:
+        s = self._last
+        heap = self._heap
+        while heap:
+            k1, k2, n = heap[0]
+            if self._open.get(n) != (k1, k2): # entrée périmée
+                heappop(heap)
+                continue
+            if (k1, k2) >= self._key(s) and self._rhs.get(s, inf) == self._g.get(s, inf):
+                break
+            heappop(heap)
+            key = self._key(n)
+            if (k1, k2) < key: # clé calculée avec un ancien départ
+                self._push(n)
+                continue
+            del self._open[n]
+            if self._g.get(n, inf) > self._rhs.get(n, inf):
+                self._g[n] = self._rhs[n]
+                for p in self._predecessors(n):
+                    self._update(p)
+            else:
+                self._g.pop(n, None)
+                self._update(n)
+                for p in self._predecessors(n):
+                    self._update(p)
+
+    def updateCells(self, cells: dict) -> None:
+        """
+            updateCells
+            ===========
+
+            Description :
+            -------------
+            Changes the value of some cases of the maze, the next solve repairs the previous search.
+
+            Parameters :
+            ------------
+                cells (dict): new value of the cases, by coordinates ({(x, y): WALL, ...}).
+        """
+
+        grid = self._grid
+        for c, v in cells.items():
+            c = tuple(c)
+            if not grid.contains(c):
+                raise ValueError("case %s is not in the maze of shape %s" % (c, self.shape))
+            n = grid.index(c)
+            if grid.cells[n] == v:
+                continue
+            grid.cells[n] = v
+            grid._ends = None
+            if v == START:
+                self.start = c
+            self._update(n)
+            for p in self._predecessors(n):
+                self._update(p)
+
+    def solve(self, start=None) -> list:
+        """
+            solve
+            =====
+
+            Description :
+            -------------
+            Returns the path of minimal cost from start to an exit (None if there is no path).
+
+            Parameters :
+            ------------
+                start (tuple of int): coordinates of the starting point (the START case of the maze by default).
+
+            Returns:
+            --------
+                list of tuple of int: path.
+        """
+
+        if start is None:
+            start = self.start
+            if start is None:
+                return None
+        start = tuple(start)
+        grid = self._grid
+        if not grid.contains(start):
+            raise ValueError("starting point %s is not in the maze of shape %s" % (start, self.shape))
+        s = grid.index(start)
+        if grid.cells[s] == END:
+            return [start]
+
+        if self._last is None:
+            self._last = s
+            for n in list(self._open): # clés calculées sans départ
+                self._push(n)
+        elif s != self._last:
+            self._km += self._steps(self._last, s)
+            self._last = s
+        self._update(s) # le départ peut ne pas être un chemin : son coût n'est pas tenu à jour
+        self._compute()
+
+        if self._rhs.get(s, inf) == inf:
+            return None
+        path = [s]
+        cells = grid.cells
+        while cells[path[-1]] != END: # suit les cases dont le coût jusqu'à une sortie est minimal
+            n = path[-1]
+            best, nxt = inf, None
+            for o in self.moves.offsets:
+                cost = _COSTS[cells[n+o]]
+                if cost and cost + self._g.get(n+o, inf) < best:
+                    best, nxt = cost + self._g.get(n+o, inf), n+o
+            path.append(nxt)
+        return [grid.coordinate(c) for c in path]
+
+
+class ClusterGraph:
+    """
+        ClusterGraph
+        ============
+
+        Description :
+        -------------
+        Hierarchical pathfinding (HPA*) for big mazes solved many times. \n
+        The maze is cut into clusters of size cases in each dimension. Once, at creation, the graph finds
+        the entrances between neighbour clusters (one pair of cases for each group of side-by-side crossings)
+        and the distance between the entrances and exits of each cluster. solve then searches this small
+        graph, and only computes the cases of the path inside the clusters it goes through. \n
+        Paths are as short as the entrances allow : sometimes a few steps longer than the shortest path.
+        The graph can be saved next to the maze (see saveClusterGraph function), and updateCells
+        only computes again the clusters that changed.
+
+        Exemple :
+        ---------
+        >>> graph = ClusterGraph([[2,1,3], [0,1,0], [0,0,0]], size=2)
+        >>> graph.solve()
+        [(0, 0), (1, 0), (2, 0), (2, 1), (2, 2), (1, 2), (0, 2)]
+        >>> graph.updateCells({(0, 1): PATH})
+        >>> graph.solve()
+        [(0, 0), (0, 1), (0, 2)]
+
+        Parameters :
+        ------------
+            maze (list, FlatNarray or PackedNarray): n-dimensional array of int (never modified).
+            laws (dict or MoveSet): laws (NO_BAN and CYCLIC are not supported).
+            size (int or list of int): size of the clusters (in each dimension).
+
+        Attributes :
+        ------------
+            shape (tuple of int): shape of the maze.
+            moves (MoveSet): compiled laws.
+            start (tuple of int): coordinates of the starting point (None if there is no START).
+            size (tuple of int): size of the clusters.
+            clusters (tuple of int): number of clusters in each dimension.
+    """
+
+    def __init__(self, maze: list, laws={}, size=16):
+        self._setup(maze, laws, size)
+        for k in range(prod(self.clusters)):
+            self._out[k], self._ends[k] = self._scan(k)
+        for k in range(prod(self.clusters)):
+            self._nodes[k] = self._nodesOf(k)
+            self._intra[k] = self._connect(k)
+
+    def _setup(self, maze: list, laws, size) -> None:
+        self._grid = _toGrid(maze)
+        self.shape = self._grid.shape
+        if not isinstance(laws, MoveSet):
+            laws = compileLaws(laws, self.shape)
+        elif laws.shape != self.shape:
+            raise ValueError("laws compiled for shape %s, maze has shape %s" % (laws.shape, self.shape))
+        if laws.noBan or laws.cycles:
+            raise ValueError("ClusterGraph does not support NO_BAN nor CYCLIC dimensions")
+        self.moves = laws
+        self.size = tuple(size) if type(size) in (list, tuple) else (size,) * len(self.shape)
+        if len(self.size) != len(self.shape) or min(self.size) < 1:
+            raise ValueError("cluster size %s does not fit a maze of shape %s" % (size, self.shape))
+        self.clusters = tuple(-(-l // s) for l, s in zip(self.shape, self.size))
+        self._strides = narrayStrides(self.clusters)
+        self._offsets = [o for o in laws.offsets if o != 0]
+
+        start = self._grid.cells.find(START)
+        self.start = None if start == -1 else self._grid.coordinate(start)
+
+        # numéro du cluster de chaque case, -1 autour du labyrinthe
+        grid = self._grid
+        self._cluster = array("i", [-1]) * len(grid.cells)
+        l, s = self.shape[-1], self.size[-1]
+        rows = {} # numéros d'une ligne de la dernière dimension, par cluster de début de ligne
+        for row in product(*[range(x) for x in self.shape[:-1]]):
+            base = sum(x // z * t for x, z, t in zip(row, self.size, self._strides))
+            if base not in rows:
+                rows[base] = array("i", [base + x // s for x in range(l)])
+            j = grid.index(row + (0,))
+            self._cluster[j:j+l] = rows[base]
+
+        self._out = {} # entrées de chaque cluster : case -> cases des clusters voisins où elle mène
+        self._ends = {} # sorties de chaque cluster
+        self._nodes = {} # entrées, cases d'arrivée depuis les voisins et sorties de chaque cluster
+        self._intra = {} # distances dans chaque cluster : case -> [(case, distance)]
+
+    def _cells(self, k: int):
+        # indices des cases du cluster k, ligne par ligne
+        corner = []
+        for t, z in zip(self._strides, self.size):
+            x, k = divmod(k, t)
+            corner.append(x * z)
+        ranges = [range(x, min(x + z, l)) for x, z, l in zip(corner, self.size, self.shape)]
+        for row in product(*ranges[:-1]):
+            j = self._grid.index(row + (ranges[-1][0],))
+            yield from range(j, j + len(ranges[-1]))
+
+    def _neighbours(self, k: int) -> list:
+        # clusters qu'un déplacement peut atteindre depuis k (au plus un cluster plus loin dans chaque dimension)
+        c = []
+        for t in self._strides:
+            x, k = divmod(k, t)
+            c.append(x)
+        return [sum(x * t for x, t in zip(n, self._strides)) for n in product(*[
+            range(max(0, x-1), min(l, x+2)) for x, l in zip(c, self.clusters)]) if list(n) != c]
+
+    def _scan(self, k: int) -> (dict, list):
+        # entrées du cluster k : une paire (case, case voisine) par groupe de passages côte à côte
+        cells, cluster = self._grid.cells, self._cluster
+        crossings, ends = set(), []
+        for a in self._cells(k):
+            if cells[a] == END:
+                ends.append(a)
+            elif cells[a] == PATH:
+                for o in self._offsets:
+                    if cluster[a+o] not in (k, -1) and _OPEN[cells[a+o]]:
+                        crossings.add((a, o))
+        # passages voisins : même déplacement, cases de départ (et d'arrivée) liées par un déplacement réversible
+        offsets = set(self._offsets)
+        sides = [o for o in self._offsets if -o in offsets]
+        out = {}
+        while crossings:
+            group = [crossings.pop()]
+            for a, o in group:
+                for t in sides:
+                    p = (a+t, o)
+                    if p in crossings and cluster[a+t+o] == cluster[a+o]:
+                        crossings.remove(p)
+                        group.append(p)
+            a, o = sorted(group)[len(group) // 2]
+            out.setdefault(a, []).append(a+o)
+        return out, ends
+
+    def _nodesOf(self, k: int) -> set:
+        nodes = set(self._out[k]) | set(self._ends[k])
+        cluster = self._cluster
+        for n in self._neighbours(k):
+            for targets in self._out[n].values():
+                nodes.update(b for b in targets if cluster[b] == k)
+        return nodes
+
+    def _search(self, k: int, source: int, targets: set) -> (dict, dict):
+        """
+            Breadth-first search inside the cluster k from source.
+            Returns the parent of each reached case and the distance to the reached targets.
+        """
+
+        cells, cluster = self._grid.cells, self._cluster
+        parents = {source: None}
+        found = {}
+        frontier = [source]
+        d = 0
+        while frontier and len(found) < len(targets):
+            d += 1
+            newFrontier = []
+            for n in frontier:
+                for o in self._offsets:
+                    v = n+o
+                    if v in parents or cluster[v] != k or not _OPEN[cells[v]]:
+                        continue
+                    parents[v] = n
+                    if v in targets:
+                        found[v] = d
+                    if cells[v] == PATH: # une sortie termine le chemin
+                        newFrontier.append(v)
+            frontier = newFrontier
+        return parents, found
+
+    def _connect(self, k: int) -> dict:
+        nodes = self._nodes[k]
+        cells = self._grid.cells
+        return {u: list(self._search(k, u, nodes - {u})[1].items()) for u in nodes if cells[u] != END}
+
+    def invalidate(self, coordinate: tuple) -> None:
+        """
+            invalidate
+            ==========
+
+            Description :
+            -------------
+            Computes again the entrances and distances of the cluster of the case at coordinate,
+            and the entrances of its neighbours (see updateCells).
+
+            Parameters :
+            ------------
+                coordinate (tuple of int): coordinates of a case of the cluster.
+        """
+
+        coordinate = tuple(coordinate)
+        if not self._grid.contains(coordinate):
+            raise ValueError("case %s is not in the maze of shape %s" % (coordinate, self.shape))
+        k = self._cluster[self._grid.index(coordinate)]
+        around = self._neighbours(k)
+        for n in [k] + around:
+            self._out[n], self._ends[n] = self._scan(n)
+        for n in [k] + around:
+            nodes = self._nodesOf(n)
+            if n == k or nodes != self._nodes[n]: # les distances d'un voisin ne changent qu'avec ses entrées
+                self._nodes[n] = nodes
+                self._intra[n] = self._connect(n)
+
+    def updateCells(self, cells: dict) -> None:
+        """
+            updateCells
+            ===========
+
+            Description :
+            -------------
+            Changes the value of some cases of the maze and computes again the clusters that contain them.
+
+            Parameters :
+            ------------
+                cells (dict): new value of the cases, by coordinates ({(x, y): WALL, ...}).
+        """
+
+        grid = self._grid
+        changed = {}
+        for c, v in cells.items():
+            c = tuple(c)
+            if not grid.contains(c):
+                raise ValueError("case %s is not in the maze of shape %s" % (c, self.shape))
+            n = grid.index(c)
+            if grid.cells[n] == v:
+                continue
+            grid.cells[n] = v
+            grid._ends = None
+            if v == START:
+                self.start = c
+            changed.setdefault(self._cluster[n], c)
+        for c in changed.values():
+            self.invalidate(c)
+
+    def solve(self, start=None) -> list:
+        """
+            solve
+            =====
+
+            Description :
+            -------------
+            Returns a path from start to an exit (None if there is no path).
+
+            Parameters :
+            ------------
+                start (tuple of int): coordinates of the starting point (the START case of the maze by default).
+
+            Returns:
+            --------
+                list of tuple of int: path.
+        """
+
+        if start is None:
+            start = self.start
+            if start is None:
+                return None
+        start = tuple(start)
+        grid = self._grid
+        if not grid.contains(start):
+            raise ValueError("starting point %s is not in the maze of shape %s" % (start, self.shape))
+        s = grid.index(start)
+        if grid.cells[s] == END:
+            return [start]
+        if not grid.ends:
+            return None
+
+        # le départ est relié aux entrées de son cluster, et des clusters voisins où il entre directement
+        cells, cluster = grid.cells, self._cluster
+        k = cluster[s]
+        extra = {s: list(self._search(k, s, self._nodes[k])[1].items())}
+        for o in self._offsets:
+            b = s+o
+            if cluster[b] not in (k, -1) and _OPEN[cells[b]]:
+                extra[s].append((b, 1))
+                if cells[b] == PATH:
+                    extra[b] = list(self._search(cluster[b], b, self._nodes[cluster[b]] - {b})[1].items())
+
+        # A* sur le graphe des clusters
+        heuristic = manhattanHeuristic([grid.coordinate(e) for e in grid.ends], self.moves.laws)
+        g = {s: 0}
+        parents = {s: None}
+        heap = [(heuristic(start), 0, s)]
+        while heap:
+            f, d, n = heappop(heap)
+            if -d > g[n]:
+                continue
+            if cells[n] == END:
+                break
+            links = self._intra[cluster[n]].get(n, []) + [(b, 1) for b in self._out[cluster[n]].get(n, [])]
+            for v, w in links + extra.get(n, []):
+                gv = w - d
+                if gv < g.get(v, inf):
+                    g[v] = gv
+                    parents[v] = n
+                    heappush(heap, (gv + heuristic(grid.coordinate(v)), -gv, v))
+        else:
+            return None
+
+        # chemin détaillé, seulement dans les clusters traversés
+        route = []
+        while n is not None:
+            route.append(n)
+            n = parents[n]
+        route.reverse()
+        path = [s]
+        for u, v in zip(route, route[1:]):
+            if cluster[u] != cluster[v]: # passage d'un cluster à l'autre
+                path.append(v)
+                continue
+            steps = self._search(cluster[u], u, {v})[0]
+            piece = []
+            while v != u:
+                piece.append(v)
+                v = steps[v]
+            path.extend(reversed(piece))
+        return [grid.coordinate(c) for c in path]
+
+
+def _resolveShared(name: str, shape: list, laws, engine: str) -> list:
+    """
+        Solves a maze flattened in a shared memory block (worker of resolveMany).
+    """
+
+    block = shared_memory.SharedMemory(name=name)
+    try:
+        grid = _Grid.fromFlat(block.buf, shape)
+    finally:
+        block.close()
+    solver = Solver(grid, laws, engine)
+    return solver.solve() if solver.start is not None else None
+
+
+def resolveMany(mazes, laws={}, workers=None, engine="bfs", ordered=True):
+    """
+        resolveMany
+        ===========
+
+        Description :
+        -------------
+        Resolves independent mazes in parallel, in a pool of worker processes. \n
+        Each maze is flattened in a shared memory block (one byte per case, row by row) instead
+        of being pickled as nested lists, and the paths are yielded as soon as they are found.
+        Mazes without any case are not sent to the workers (their path is None).
+
+        Exemple :
+        ---------
+        >>> mazes = [[[2,1,3], [0,1,0], [0,0,0]], [[2,0,3]]]
+        >>> list(resolveMany(mazes, workers=2))
+        [[(0, 0), (1, 0), (2, 0), (2, 1), (2, 2), (1, 2), (0, 2)], [(0, 0), (0, 1), (0, 2)]]
+        >>> sorted(resolveMany(mazes, ordered=False))
+        [(0, [(0, 0), (1, 0), (2, 0), (2, 1), (2, 2), (1, 2), (0, 2)]), (1, [(0, 0), (0, 1), (0, 2)])]
+
+        Parameters :
+        ------------
+            mazes (iterable): mazes (n-dimensional arrays of int, FlatNarray or PackedNarray), or (maze, laws) as returned by loadNarray.
+            laws (dict or MoveSet): laws of the mazes given without laws.
+            workers (int): number of processes (number of CPUs by default).
+            engine (str): search engine (see resolve function for details).
+            ordered (bool): yields the paths in the order of mazes if True, else yields (index, path) as soon as found.
+
+        Returns:
+        --------
+            iterator of list of tuple of int: paths (None if a maze has no solution).
+            iterator of (int, list of tuple of int): if ordered is False.
+    """
+
+    if engine not in _ENGINES:
+        raise ValueError("unknown engine %r, availible engines : %s" % (engine, ", ".join(_ENGINES)))
+    workers = workers or os.cpu_count() or 1
+
+    mazes = enumerate(mazes)
+    pending = {} # tâche en cours -> (indice, bloc de mémoire partagée)
+    done = {} # chemins trouvés en attente de leur tour (ordered=True)
+    following = 0 # indice du prochain chemin à retourner (ordered=True)
+    with ProcessPoolExecutor(workers) as pool:
+        try:
+            while True:
+                while len(pending) < 2 * workers: # limite le nombre de labyrinthes en mémoire partagée
+                    item = next(mazes, None)
+                    if item is None:
+                        break
+                    i, maze = item
+                    mazeLaws = laws
+                    if type(maze) is tuple: # (maze, laws) comme retourné par loadNarray
+                        maze, mazeLaws = maze
+                    shape = maze.shape if isinstance(maze, (FlatNarray, PackedNarray)) else narrayShape(maze)
+                    if prod(shape) == 0: # aucune case -> aucun chemin, comme resolve
+                        if not ordered:
+                            yield i, None
+                        else:
+                            done[i] = None
+                        continue
+                    block = shared_memory.SharedMemory(create=True, size=prod(shape))
+                    if isinstance(maze, FlatNarray):
+                        block.buf[:prod(shape)] = maze.cases
+                    else: # aplatit directement dans la mémoire partagée, ligne par ligne
+                        j = 0
+                        for row in _narrayRows(maze):
+                            block.buf[j:j+len(row)] = _caseBytes(row)
+                            j += len(row)
+                    pending[pool.submit(_resolveShared, block.name, shape, mazeLaws, engine)] = i, block
+                while following in done: # avant de s'arrêter : les labyrinthes sans case n'attendent aucune tâche
+                    yield done.pop(following)
+                    following += 1
+                if not pending:
+                    break
+
+                finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for task in finished:
+                    i, block = pending.pop(task)
+                    block.close()
+                    block.unlink()
+                    if not ordered:
+                        yield i, task.result()
+                    else:
+                        done[i] = task.result()
+                while following in done:
+                    yield done.pop(following)
+                    following += 1
+        finally:
+            for task, (i, block) in pending.items(): # arrêt anticipé : libère la mémoire partagée
+                task.cancel()
+                block.close()
+                block.unlink()
+
+
+def distanceField(maze: list, laws={}) -> array:
+    """
+        distanceField
+        =============
+
+        Description :
+        -------------
+        Returns the number of steps from each case of maze to the nearest exit. \n
+        All the exits are flooded at once (reverse breadth-first search), then the shortest path
+        from any starting point is found in O(path length) by distanceFieldPath.
+
+        The field is a flat array (see narrayFlatten) : the distance of the case c is
+        field[sum(x*s for x, s in zip(c, narrayStrides(shape)))]. Exits are 0, cases from which
+        no exit can be reached (walls, START, ...) are -1.
+
+        Exemple :
+        ---------
+        >>> distanceField([[2,1,3], [0,1,0], [0,0,0]])
+        array('i', [-1, -1, 0, 5, -1, 1, 4, 3, 2])
+
+        Parameters :
+        ------------
+            maze (list, FlatNarray or PackedNarray): n-dimensional array of int.
+            laws (dict or MoveSet): laws.
+
+        Returns:
+        --------
+            array of int: distance of each case to the nearest exit.
+    """
+
+    grid = _toGrid(maze)
+    moves = laws if isinstance(laws, MoveSet) else compileLaws(laws, grid.shape)
+    if moves.shape != grid.shape:
+        raise ValueError("laws compiled for shape %s, maze has shape %s" % (moves.shape, grid.shape))
+    if moves.cycles:
+        raise ValueError("distanceField does not support CYCLIC dimensions")
+
+    cells = grid.cells
+    distances = array("i", [-1]) * len(cells)
+    backward = [-o for o in moves.offsets if o != 0] # cases depuis lesquelles on atteint la case courante
+    frontier = list(grid.ends)
+    for e in frontier:
+        distances[e] = 0
+    d = 0
+    while frontier:
+        d += 1
+        newFrontier = []
+        for n in frontier:
+            for o in backward:
+                if cells[n+o] == PATH and distances[n+o] < 0:
+                    distances[n+o] = d
+                    newFrontier.append(n+o)
+        frontier = newFrontier
+
+    field = array("i") # retire le bord de WALL, ligne par ligne
+    l = grid.shape[-1]
+    for row in product(*[range(x) for x in grid.shape[:-1]]):
+        i = grid.index(row + (0,))
+        field += distances[i:i+l]
+    return field
+
+
+def distanceFieldPath(field: array, shape: list, start: tuple, laws={}) -> list:
+    """
+        distanceFieldPath
+        =================
+
+        Description :
+        -------------
+        Returns a shortest path from start to an exit by descending a distance field
+        (see distanceField function). \n
+        At each step, the first adjacent case (in the order of getAdjacentCoordinates) closest to an exit is chosen.
+
+        Exemple :
+        ---------
+        >>> maze = [[2,1,3], [0,1,0], [0,0,0]]
+        >>> field = distanceField(maze)
+        >>> distanceFieldPath(field, [3, 3], (0, 0))
+        [(0, 0), (1, 0), (2, 0), (2, 1), (2, 2), (1, 2), (0, 2)]
+
+        Parameters :
+        ------------
+            field (array of int): distance field of the maze.
+            shape (list of int): shape of the maze.
+            start (tuple of int): coordinates of the starting point.
+            laws (dict or MoveSet): laws used to compute field.
+
+        Returns:
+        --------
+            list of tuple of int: path (None if no exit can be reached from start).
+    """
+
+    moves = laws if isinstance(laws, MoveSet) else compileLaws(laws, shape)
+    strides = narrayStrides(shape)
+    deltas = [d for d in moves.deltas if any(d)]
+
+    def distance(c: tuple) -> int:
+        if all(isLegalCoordinate1D(x, l) for x, l in zip(c, shape)):
+            return field[sum(x * s for x, s in zip(c, strides))]
+        return -1
+
+    c = tuple(start)
+    path = [c]
+    d = distance(c)
+    while d != 0:
+        best, d = None, -1
+        for delta in deltas: # la case adjacente la plus proche d'une sortie
+            a = tuple(x + y for x, y in zip(c, delta))
+            da = distance(a)
+            if da >= 0 and (best is None or da < d):
+                best, d = a, da
+        if best is None:
+            return None
+        c = best
+        path.append(c)
+    return path
+
+
+def narrayShape(narray: list):
+    """
+        narrayShape
+        =======
+
+        Description :
+        -------------
+        Returns the shape of narray.
+
+        Exemple :
+        ---------
+        >>> narrayShape([[1,2], [3,4], [4,5]])
+        [3, 2]
+
+        Parameters :
+        ------------
+            narray (list): n-dimensional array of int.
+
+        Returns:
+        --------
+            list of int: shape of narray.
+    """
+
+    if type(narray) is not list:
+        return []
+    if not narray: # tableau vide : ses dimensions suivantes sont inconnues
+        return [0]
+    return [len(narray)] + narrayShape(narray[0])
+    # revient à faire [len(narray), len(narray[0]), len(array[0][0]), ... ]
+    
+
+def narrayFlatten(narray: list):
+    """
+        narrayFlatten
+        =======
+
+        Description :
+        -------------
+        Flattens a n-dimensional array to unidimensional array.
+
+        Exemple :
+        ---------
+        >>> narrayFlatten([[1,2], [3,4], [4,5]])
+        [1, 2, 3, 4, 4, 5]
+
+        Parameters :
+        ------------
+            narray (list): n-dimensional array of int.
+
+        Returns:
+        --------
+            list of int: unidimensional array.
+    """
+
+    if type(narray[0]) is not list:
+        return narray
+    fnarray = []
+    for a in narray:
+        fnarray += narrayFlatten(a)
+    return fnarray
+
+
+def narrayUnflatten(array: list, shape: list):
+    """
+        narrayUnlatten
+        ==============
+
+        Description :
+        -------------
+        Gives the desired shape to array.
+
+        Exemple :
+        ---------
+        >>> narrayUnlatten([1, 2, 3, 4, 4, 5], [3, 2])
+        [[1,2], [3,4], [4,5]]
+
+        Parameters :
+        ------------
+            array (list of int): unidimensional array of int.
+            shape (list of int): the shape to give to array.
+
+        Returns:
+        --------
+            list: n-dimensional array of int.
+    """
+
+    if len(shape) == 1:
+        return array
+    s = len(array)//shape[0]
+    narray = []
+    for i in range(0, len(array), s):
+        subarray = [array[j] for j in range(i, i+s)]
+        narray.append(narrayUnflatten(subarray, shape[1:]))
+    return narray
+
+
+class FlatNarray:
+    """
+        FlatNarray
+        ==========
+
+        Description :
+        -------------
+        N-dimensional array of int stored flat, one byte per case (see narrayFlatten function). \n
+        Can be given to resolve, Solver, distanceField and resolveMany instead of a n-dimensional
+        array, for example straight from a memory-mapped file (see mapNarray function).
+
+        Exemple :
+        ---------
+        >>> flat = FlatNarray.fromNarray([[2,1,3], [0,1,0], [0,0,0]])
+        >>> flat.shape
+        (3, 3)
+        >>> resolve(flat)
+        [(0, 0), (1, 0), (2, 0), (2, 1), (2, 2), (1, 2), (0, 2)]
+        >>> flat.toNarray()
+        [[2, 1, 3], [0, 1, 0], [0, 0, 0]]
+
+        Parameters :
+        ------------
+            cases (bytes-like): cases in the order of narrayFlatten (bytes, bytearray, memoryview, mmap, ...).
+            shape (list of int): shape of the array.
+    """
+
+    def __init__(self, cases, shape: list):
+        self.cases = cases
+        self.shape = tuple(shape)
+        if len(cases) != prod(self.shape):
+            raise ValueError("%d cases for shape %s" % (len(cases), self.shape))
+        self._mapping = None # fichier projeté en mémoire par mapNarray
+
+    def close(self) -> None:
+        """
+            Closes the memory-mapped file of a FlatNarray returned by mapNarray (cases can no longer be read).
+            Nothing to do for other FlatNarray.
+        """
+
+        if self._mapping is not None:
+            self.cases.release()
+            self._mapping.close()
+            self._mapping = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    @classmethod
+    def fromNarray(cls, narray: list):
+        """
+            Returns the FlatNarray of a n-dimensional array.
+        """
+
+        return cls(bytearray(narrayFlatten(narray)), narrayShape(narray))
+
+    def toNarray(self) -> list:
+        """
+            Returns the n-dimensional array.
+        """
+
+        return narrayUnflatten(list(self.cases), list(self.shape))
+
+
+class PackedNarray:
+    """
+        PackedNarray
+        ============
+
+        Description :
+        -------------
+        Maze stored as a bitmap of its WALL cases (one bit per case) and the list of its
+        other special cases (START, END, weights, ...), every other case being PATH. \n
+        A maze made of PATH and WALL costs 1/8 byte per case, against 8 bytes or more in lists.
+        Can be given to resolve, Solver, distanceField, resolveMany and saveNarray like a FlatNarray. \n
+        The "bfs" engine (without NO_BAN nor CYCLIC) searches the bitmap as is : a Solver only adds
+        its buffer of visited cases (1 byte per case). The other engines and functions build their
+        padded grid (1 byte per case) straight from the bitmap.
+
+        Exemple :
+        ---------
+        >>> packed = PackedNarray.fromNarray([[2,1,3], [0,1,0], [0,0,0]])
+        >>> packed.specials
+        {0: 2, 2: 3}
+        >>> resolve(packed)
+        [(0, 0), (1, 0), (2, 0), (2, 1), (2, 2), (1, 2), (0, 2)]
+        >>> packed.toNarray()
+        [[2, 1, 3], [0, 1, 0], [0, 0, 0]]
+
+        Parameters :
+        ------------
+            walls (bytes-like): bitmap of the WALL cases, case i (order of narrayFlatten) being bit i%8 of byte i//8.
+            specials (dict): value of the cases that are neither PATH nor WALL, by index (order of narrayFlatten).
+            shape (list of int): shape of the array.
+    """
+
+    def __init__(self, walls, specials: dict, shape: list):
+        self.walls = walls
+        self.specials = specials
+        self.shape = tuple(shape)
+        if len(walls) != (prod(self.shape) + 7) // 8:
+            raise ValueError("%d bytes of walls for shape %s" % (len(walls), self.shape))
+
+    @classmethod
+    def fromFlat(cls, cases, shape: list):
+        """
+            Returns the PackedNarray of the cases of a maze flattened by narrayFlatten (any bytes-like object).
+        """
+
+        cases = bytes(cases)
+        bits = cases.translate(_WALL_BITS) + bytes(-len(cases) % 8) # 1 par WALL, complété à un multiple de 8
+        specials = {m.start(): m.group()[0] for m in re.finditer(b"[^%c%c]" % (PATH, WALL), cases)}
+        return cls(bytes(map(_BITS_BYTE.__getitem__, memoryview(bits).cast("Q"))), specials, shape)
+
+    @classmethod
+    def fromNarray(cls, narray: list):
+        """
+            Returns the PackedNarray of a n-dimensional array.
+        """
+
+        return cls.fromFlat(_caseBytes(narrayFlatten(narray)), narrayShape(narray))
+
+    def toFlat(self) -> FlatNarray:
+        """
+            Returns the FlatNarray of the maze.
+        """
+
+        cases = bytearray(self._cases(0, prod(self.shape)))
+        for i, v in self.specials.items():
+            cases[i] = v
+        return FlatNarray(cases, self.shape)
+
+    def _cases(self, i: int, l: int) -> bytes:
+        """
+            Returns the l cases from index i read from the bitmap only (PATH or WALL, without the specials).
+        """
+
+        walls = self.walls[i >> 3:(i + l + 7) >> 3]
+        return b"".join(map(_BYTE_CASES.__getitem__, walls))[i & 7:(i & 7) + l]
+
+    def toNarray(self) -> list:
+        """
+            Returns the n-dimensional array.
+        """
+
+        return self.toFlat().toNarray()
+
+
+class LazyNarray:
+    """
+        LazyNarray
+        ==========
+
+        Description :
+        -------------
+        Maze whose cases are computed on demand instead of being stored. \n
+        cell is either a function called with the coordinates (cell(t, x, y) for a maze of dimension 3),
+        or an object indexed by coordinate tuples (cell[t, x, y], like a numpy array). \n
+        Only the "bfs" engine of resolve can solve it : visited cases are kept in a set,
+        so only the cases next to the explored ones are ever evaluated.
+
+        With chunk, cases are evaluated by blocks of shape chunk and the cacheSize
+        most recently used blocks are kept, useful when cell is slow.
+
+        Exemple :
+        ---------
+        >>> def cell(t, x):
+        ...     if (t, x) == (0, 0): return START
+        ...     if x == 9: return END
+        ...     return WALL if x == 5 and t % 4 else PATH
+        >>> resolve(LazyNarray(cell, [100, 10], start=(0, 0)), {1: JUMP_FORWARD})
+        [(0, 0), (1, 0), (2, 0), (3, 0), (4, 1), (5, 2), (6, 3), (7, 4), (8, 5), (9, 6), (10, 7), (11, 8), (12, 9)]
+
+        Parameters :
+        ------------
+            cell (function or object): value of a case from its coordinates.
+            shape (list of int): shape of the maze.
+            start (tuple of int): coordinates of the starting point (searched case by case if not given).
+            chunk (list of int): shape of the cached blocks (no cache by default).
+            cacheSize (int): number of cached blocks.
+    """
+
+    def __init__(self, cell, shape: list, start=None, chunk=None, cacheSize=64):
+        self.cell = cell
+        self.shape = tuple(shape)
+        self.start = None if start is None else tuple(start)
+        self.chunk = None if chunk is None else tuple(chunk)
+        self.cacheSize = cacheSize
+        if self.chunk is not None and len(self.chunk) != len(self.shape):
+            raise ValueError("chunk %s does not match shape %s" % (self.chunk, self.shape))
+        self._get = cell if callable(cell) else lambda *c: cell[c]
+        self._chunks = OrderedDict() # blocs les plus récemment utilisés en dernier
+
+    def case(self, c: tuple) -> int:
+        """
+            Returns the value of the case at coordinates c (that must be in the maze).
+        """
+
+        if self.chunk is None:
+            return self._get(*c)
+        key = tuple(x // k for x, k in zip(c, self.chunk))
+        block = self._chunks.get(key)
+        if block is None:
+            block = self._evaluate(key)
+            self._chunks[key] = block
+            if len(self._chunks) > self.cacheSize:
+                self._chunks.popitem(last=False)
+        else:
+            self._chunks.move_to_end(key)
+        cases, origin, strides = block
+        return cases[sum((x - o) * s for x, o, s in zip(c, origin, strides))]
+
+    def _evaluate(self, key: tuple) -> tuple:
+        origin = [x * k for x, k in zip(key, self.chunk)]
+        extent = [min(k, l - o) for k, l, o in zip(self.chunk, self.shape, origin)] # blocs tronqués au bord
+        cases = bytes(self._get(*c) for c in product(*[range(o, o+e) for o, e in zip(origin, extent)]))
+        return cases, origin, narrayStrides(extent)
+
+    def findStart(self) -> tuple:
+        """
+            Returns the coordinates of the starting point, evaluating cases until the START is found.
+        """
+
+        if self.start is None:
+            for c in product(*[range(l) for l in self.shape]):
+                if self.case(c) == START:
+                    self.start = c
+                    break
+        return self.start
+
+
+def _resolveLazy(maze: LazyNarray, moves: MoveSet) -> list:
+    """
+        Breadth-first search on a LazyNarray, same results as the "bfs" engine.
+
+        The parent of each visited case is kept in a dict, the path is rebuilt once an END is found.
+        With NO_BAN, a case can be reached once per stage, so nodes (case, parent node) are kept instead.
+    """
+
+    start = maze.findStart()
+    if start is None:
+        return None
+    shape = maze.shape
+    deltas = moves.deltas
+
+    def adjacents(c: tuple):
+        for d in deltas:
+            a = tuple(x + y for x, y in zip(c, d))
+            if moves.cycles: # les dimensions CYCLIC reviennent à 0 après la fin
+                a = tuple(x % l if i in moves.cycles else x for i, (x, l) in enumerate(zip(a, shape)))
+            if all(0 <= x < l for x, l in zip(a, shape)):
+                yield a, maze.case(a)
+
+    if moves.noBan:
+        nodes, parents = [start], [-1]
+        repetition = _Repetition()
+        lo = 0
+        while lo < len(nodes):
+            hi = len(nodes)
+            if repetition.check(frozenset(nodes[lo:hi])):
+                return None
+            stage = set() # cases de l'étape suivante
+            for i in range(lo, hi):
+                nexts = list(adjacents(nodes[i]))
+                for a, v in nexts:
+                    if v == END:
+                        path = [a]
+                        while i >= 0:
+                            path.append(nodes[i])
+                            i = parents[i]
+                        return path[::-1]
+                for a, v in nexts:
+                    if v == PATH and a not in stage:
+                        stage.add(a)
+                        nodes.append(a)
+                        parents.append(i)
+            lo = hi
+        return None
+
+    parents = {start: None} # cases visitées (et bannies)
+    frontier = [start]
+    while frontier:
+        newFrontier = []
+        for c in frontier:
+            nexts = list(adjacents(c))
+            for a, v in nexts:
+                if v == END and a not in parents:
+                    path = [a]
+                    while c is not None:
+                        path.append(c)
+                        c = parents[c]
+                    return _unwrapCycles(path[::-1], moves) if moves.cycles else path[::-1]
+            for a, v in nexts:
+                if v == PATH and a not in parents:
+                    parents[a] = c
+                    newFrontier.append(a)
+        frontier = newFrontier
+    return None
+
+
+def narray2str(narray: list, laws={}) -> str:
+    """
+        narray2str
+        ==========
+
+        Description :
+        -------------
+        Stringify narray and laws.
+
+        Exemple :
+        ---------
+        >>> narray2str([[1, 2],[3, 4],[4, 5]])
+        3:2:
+        0:0:
+        1:2:3:4:4:5:
+        0
+
+        Parameters :
+        ------------
+            narray (list): n-dimensional array of int.
+            laws (dict): laws.
+
+        Returns:
+        --------
+            str: stringified narray and laws.
+    """
+
+    return "".join(_narrayText(narray, laws))
+
+
+def _narrayText(narray: list, laws={}):
+    """
+        Yields the pieces of the string of narray2str : the header lines, then one piece per row.
+    """
+
+    shape = narray.shape if isinstance(narray, (FlatNarray, PackedNarray)) else narrayShape(narray)
+    yield "".join(str(d) + ":" for d in shape) + "\n"
+    yield "".join(str(laws.get(l+1, FREE)) + ":" for l in range(len(shape))) + "\n"
+    for row in _narrayRows(narray):
+        yield ":".join(map(str, row)) + ":"
+    yield "\n1" if laws.get("NO_BAN") else "\n0"
+
+
+def str2narray(data: str) -> (list, dict):
+    """
+        str2narray
+        ==========
+
+        Description :
+        -------------
+        Convert string to n-dimensional array and laws.
+
+        Exemple :
+        ---------
+        >>> s = "3:2:\n0:0:\n1:2:3:4:4:5:\0"
+        >>> a, l = str2narray(s)
+        >>> a
+        [[1, 2],[3, 4],[4, 5]]
+        >>> l
+        {1: 0, 2: 0, "NO_BAN": false}
+
+        Parameters :
+        ------------
+            data (str): stringified narray and laws.
+
+        Returns:
+        --------
+            (list, dict): n-dimensional array and laws.
+    """
+
+    data = data.split("\n")
+    shape = [int(x) for x in data[0].split(":")[:-1]]
+    laws = [int(x) for x in data[1].split(":")[:-1]]
+    array = [int(x) for x in data[2].split(":")[:-1]]
+    narray = narrayUnflatten(array, shape)
+    dlaws = {}
+    for l in range(len(laws)):
+        dlaws[l+1] = laws[l]
+    dlaws["NO_BAN"] = int(data[3][0])
+    return narray, dlaws
+        
+def saveNarray(path: str, narray: list, laws={}, binary=False) -> None:
+    """
+        saveNarray
+        ==========
+
+        Description :
+        -------------
+        Save narray and laws in a file.
+
+        With binary=True, the file is written in the binary format (one byte per case),
+        that loads much faster and can be memory-mapped (see mapNarray function).
+        The text format is the one of pathfinder.js (see narray2str function).
+
+        The file is written row by row, without building it in memory,
+        and compressed with gzip if path ends with ".gz".
+
+        Binary format :
+        ---------------
+        b"PFMZ", version (1 byte), number of dimensions n (1 byte), shape (n * 8 bytes, little-endian),
+        laws (n * 1 byte), NO_BAN (1 byte), then the cases (1 byte per case, in the order of narrayFlatten).
+
+        Parameters :
+        ------------
+            path (str): file path.
+            narray (list, FlatNarray or PackedNarray): n-dimensional array.
+            laws (dict): laws.
+            binary (bool): binary format if True, else text format.
+    """
+
+    opener = gzip.open if path.endswith(".gz") else open
+    if not binary:
+        save = opener(path, "wt")
+        for piece in _narrayText(narray, laws):
+            save.write(piece)
+        save.close()
+        return None
+
+    shape = narray.shape if isinstance(narray, (FlatNarray, PackedNarray)) else narrayShape(narray)
+    save = opener(path, "wb")
+    save.write(_MAZE_MAGIC + struct.pack("<BB%dQ" % len(shape), 1, len(shape), *shape))
+    save.write(bytes(laws.get(d+1, FREE) for d in range(len(shape))) + bytes([1 if laws.get("NO_BAN") else 0]))
+    for row in _narrayRows(narray): # écrit ligne par ligne, sans aplatir tout le tableau
+        save.write(bytes(row))
+    save.close()
+
+
+def _narrayRows(narray):
+    """
+        Yields the rows (last dimension) of a n-dimensional array, a FlatNarray or a PackedNarray in order.
+    """
+
+    if isinstance(narray, PackedNarray): # une ligne à la fois, sans son FlatNarray
+        l = narray.shape[-1]
+        specials = sorted(narray.specials.items())
+        k = 0
+        for i in range(0, prod(narray.shape), l):
+            row = bytearray(narray._cases(i, l))
+            while k < len(specials) and specials[k][0] < i + l:
+                row[specials[k][0] - i] = specials[k][1]
+                k += 1
+            yield row
+        return None
+    if isinstance(narray, FlatNarray):
+        l = narray.shape[-1]
+        for i in range(0, len(narray.cases), l):
+            yield narray.cases[i:i+l]
+        return None
+    if not narray or type(narray[0]) is not list:
+        yield narray
+        return None
+    for a in narray:
+        yield from _narrayRows(a)
+
+
+def _readHeader(save) -> (list, dict):
+    """
+        Reads the header of a binary maze file after the magic bytes, returns shape and laws.
+    """
+
+    version, dimension = struct.unpack("<BB", save.read(2))
+    if version != 1:
+        raise ValueError("unsupported maze file version %d" % version)
+    shape = list(struct.unpack("<%dQ" % dimension, save.read(8 * dimension)))
+    header = save.read(dimension + 1)
+    laws = {d+1: header[d] for d in range(dimension)}
+    laws["NO_BAN"] = header[dimension]
+    return shape, laws
+
+
+def loadNarray(path: str, flat=False) -> (list, dict):
+    """
+        loadNarray
+        ==========
+
+        Description :
+        -------------
+        Read narray and laws from a file (text or binary format, see saveNarray function),
+        compressed with gzip or not.
+
+        The text format is parsed by chunks straight into a flat buffer (one byte per case),
+        so loading with flat=True needs about the size of the maze in memory. Text files can also hold
+        values out of 0..255 (8 bytes per case then) : they are only loaded as n-dimensional arrays.
+
+        Exemple :
+        ---------
+        >>> import tempfile
+        >>> with tempfile.TemporaryDirectory() as directory:
+        ...     path = os.path.join(directory, "values.laby")
+        ...     saveNarray(path, [[2, 300], [-1, 3]])
+        ...     loadNarray(path)
+        ([[2, 300], [-1, 3]], {1: 0, 2: 0, 'NO_BAN': 0})
 
         Parameters :
         ------------
             path (str): file path.
+            flat (bool): returns a FlatNarray instead of a n-dimensional array if True.
 
         Returns:
         --------
             (list, dict): n-dimensional array and laws.
+            (FlatNarray, dict): if flat is True.
     """
-    
-    save = open(path, "r")
-    data = save.read()
+
+    save = open(path, "rb")
+    if save.read(2) == b"\x1f\x8b": # fichier compressé par gzip
+        save.close()
+        save = gzip.open(path, "rb")
+    save.seek(0)
+    try:
+        if save.read(4) == _MAZE_MAGIC:
+            shape, laws = _readHeader(save)
+            narray = FlatNarray(bytearray(save.read(prod(shape))), shape)
+        else:
+            save.seek(0)
+            narray, laws = _readText(save)
+    finally:
+        save.close()
+    if type(narray.cases) is array: # valeurs hors d'un octet
+        if flat:
+            raise ValueError("%s holds values out of 0..255, it can only be loaded with flat=False" % path)
+        return narrayUnflatten(narray.cases.tolist(), list(narray.shape)), laws
+    return (narray if flat else narray.toNarray()), laws
+
+
+def _readText(save) -> (FlatNarray, dict):
+    """
+        Parses the text format of narray2str from a binary file, the cases by chunks.
+        The cases are bytes, or an array("q") if a value does not fit in a byte.
+    """
+
+    shape = [int(x) for x in save.readline().split(b":")[:-1]]
+    laws = {l+1: int(x) for l, x in enumerate(save.readline().split(b":")[:-1])}
+
+    cases = bytearray()
+
+    def extend(values: list) -> None:
+        nonlocal cases
+        try:
+            cases.extend(map(int, values))
+        except ValueError: # valeur hors de 0..255 -> entiers de 8 octets
+            if type(cases) is array:
+                raise
+            cases = array("q", cases)
+            cases.extend(map(int, values))
+
+    rest = b"" # début de la dernière valeur du morceau précédent
+    while True:
+        chunk = save.read(_CHUNK)
+        end = chunk.find(b"\n")
+        data = rest + (chunk if end == -1 else chunk[:end])
+        if end != -1 or not chunk: # fin de la ligne des cases
+            extend(data.split(b":")[:-1])
+            break
+        k = data.rfind(b":")
+        if k != -1:
+            extend(data[:k].split(b":"))
+        rest = data[k+1:]
+
+    noBan = (chunk[end+1:] if end != -1 else b"") + save.read(1)
+    laws["NO_BAN"] = int(noBan[:1]) if noBan[:1].isdigit() else 0
+    return FlatNarray(cases, shape), laws
+
+
+def mapNarray(path: str) -> (FlatNarray, dict):
+    """
+        mapNarray
+        =========
+
+        Description :
+        -------------
+        Memory-maps a file in the binary format (see saveNarray function) without reading it. \n
+        Nothing is parsed nor converted to lists : the search buffer is filled straight from the file.
+        The file stays mapped until the FlatNarray is closed (close method or with block).
+
+        >>> maze, laws = mapNarray("myLaby.laby")
+        >>> with maze:
+        ...     path = resolve(maze, laws)
+
+        Parameters :
+        ------------
+            path (str): file path.
+
+        Returns:
+        --------
+            (FlatNarray, dict): n-dimensional array and laws.
+    """
+
+    save = open(path, "rb")
+    try:
+        if save.read(4) != _MAZE_MAGIC:
+            raise ValueError("%s is not a binary maze file (see saveNarray)" % path)
+        shape, laws = _readHeader(save)
+        offset = save.tell()
+        mapped = mmap.mmap(save.fileno(), 0, access=mmap.ACCESS_READ)
+    finally:
+        save.close()
+    maze = FlatNarray(memoryview(mapped)[offset:offset + prod(shape)], shape)
+    maze._mapping = mapped
+    return maze, laws
+
+
+def saveDistanceField(path: str, field: array, shape: list) -> None:
+    """
+        saveDistanceField
+        =================
+
+        Description :
+        -------------
+        Save a distance field (see distanceField function) in a binary file,
+        for example next to the maze file : saveDistanceField("myLaby.laby.dist", field, shape).
+
+        File format : b"PFDF", version (1 byte), number of dimensions (1 byte),
+        shape (8 bytes per dimension) and the distances (4 bytes per case), all little-endian.
+
+        Parameters :
+        ------------
+            path (str): file path.
+            field (array of int): distance field.
+            shape (list of int): shape of the maze.
+    """
+
+    field = array("i", field)
+    if sys.byteorder == "big":
+        field.byteswap()
+    save = open(path, "wb")
+    save.write(_FIELD_MAGIC + struct.pack("<BB%dQ" % len(shape), 1, len(shape), *shape))
+    field.tofile(save)
+    save.close()
+
+
+def loadDistanceField(path: str) -> (array, list):
+    """
+        loadDistanceField
+        =================
+
+        Description :
+        -------------
+        Read a distance field saved by saveDistanceField.
+
+        Parameters :
+        ------------
+            path (str): file path.
+
+        Returns:
+        --------
+            (array of int, list of int): distance field and shape of the maze.
+    """
+
+    save = open(path, "rb")
+    if save.read(4) != _FIELD_MAGIC:
+        save.close()
+        raise ValueError("%s is not a distance field file" % path)
+    version, dimension = struct.unpack("<BB", save.read(2))
+    if version != 1:
+        save.close()
+        raise ValueError("unsupported distance field version %d" % version)
+    shape = list(struct.unpack("<%dQ" % dimension, save.read(8 * dimension)))
+    field = array("i")
+    field.fromfile(save, prod(shape))
+    save.close()
+    if sys.byteorder == "big":
+        field.byteswap()
+    return field, shape
+
+
+def saveClusterGraph(path: str, graph: ClusterGraph) -> None:
+    """
+        saveClusterGraph
+        ================
+
+        Description :
+        -------------
+        Save the entrances and distances of a ClusterGraph in a binary file,
+        for example next to the maze file : saveClusterGraph("myLaby.laby.hpa", graph).
+
+        File format : b"PFCG", version (1 byte), number of dimensions n (1 byte), shape (n * 8 bytes),
+        cluster size (n * 8 bytes), laws (n * 1 byte), CRC-32 of the maze (4 bytes), number of entrances p (8 bytes),
+        the entrances (p * 2 * 8 bytes : case, case of the neighbour cluster), number of distances q (8 bytes)
+        and the distances (q * 3 * 8 bytes : case, case, distance), all little-endian. \n
+        Cases are indexes in the flat maze padded with a layer of WALL (see _Grid class).
+
+        Parameters :
+        ------------
+            path (str): file path.
+            graph (ClusterGraph): graph to save.
+    """
+
+    shape = graph.shape
+    entrances = array("q", [x for out in graph._out.values() for a, targets in out.items() for b in targets for x in (a, b)])
+    distances = array("q", [x for intra in graph._intra.values() for u, links in intra.items() for v, d in links for x in (u, v, d)])
+    if sys.byteorder == "big":
+        entrances.byteswap()
+        distances.byteswap()
+    save = open(path, "wb")
+    save.write(_CLUSTER_MAGIC + struct.pack("<BB%dQ%dQ" % (len(shape), len(shape)), 1, len(shape), *shape, *graph.size))
+    save.write(bytes(graph.moves.laws.get(d+1, FREE) for d in range(len(shape))))
+    save.write(struct.pack("<I", zlib.crc32(graph._grid.cells)))
+    save.write(struct.pack("<Q", len(entrances) // 2))
+    entrances.tofile(save)
+    save.write(struct.pack("<Q", len(distances) // 3))
+    distances.tofile(save)
     save.close()
-    return str2narray(data)
\ No newline at end of file
+
+
+def loadClusterGraph(path: str, maze: list) -> ClusterGraph:
+    """
+        loadClusterGraph
+        ================
+
+        Description :
+        -------------
+        Read a ClusterGraph saved by saveClusterGraph, without computing it again.
+        maze must be the maze the graph was computed (or updated) for.
+
+        Parameters :
+        ------------
+            path (str): file path.
+            maze (list, FlatNarray or PackedNarray): n-dimensional array of int.
+
+        Returns:
+        --------
+            ClusterGraph: graph of maze.
+    """
+
+    save = open(path, "rb")
+    try:
+        if save.read(4) != _CLUSTER_MAGIC:
+            raise ValueError("%s is not a cluster graph file" % path)
+        version, dimension = struct.unpack("<BB", save.read(2))
+        if version != 1:
+            raise ValueError("unsupported cluster graph version %d" % version)
+        shape = list(struct.unpack("<%dQ" % dimension, save.read(8 * dimension)))
+        size = list(struct.unpack("<%dQ" % dimension, save.read(8 * dimension)))
+        laws = {d+1: law for d, law in enumerate(save.read(dimension))}
+        crc, = struct.unpack("<I", save.read(4))
+        entrances = array("q")
+        entrances.fromfile(save, 2 * struct.unpack("<Q", save.read(8))[0])
+        distances = array("q")
+        distances.fromfile(save, 3 * struct.unpack("<Q", save.read(8))[0])
+    finally:
+        save.close()
+    if sys.byteorder == "big":
+        entrances.byteswap()
+        distances.byteswap()
+
+    graph = ClusterGraph.__new__(ClusterGraph)
+    graph._setup(maze, laws, size)
+    if list(graph.shape) != shape or zlib.crc32(graph._grid.cells) != crc:
+        raise ValueError("%s was not computed for this maze" % path)
+    cluster, cells = graph._cluster, graph._grid.cells
+    for k in range(prod(graph.clusters)):
+        graph._out[k], graph._ends[k], graph._intra[k] = {}, [], {}
+    for e in graph._grid.ends:
+        graph._ends[cluster[e]].append(e)
+    for i in range(0, len(entrances), 2):
+        a, b = entrances[i], entrances[i+1]
+        graph._out[cluster[a]].setdefault(a, []).append(b)
+    for k in range(prod(graph.clusters)):
+        graph._nodes[k] = graph._nodesOf(k)
+        graph._intra[k] = {u: [] for u in graph._nodes[k] if cells[u] != END}
+    for i in range(0, len(distances), 3):
+        u = distances[i]
+        graph._intra[cluster[u]][u].append((distances[i+1], distances[i+2]))
+    return graph